@@ -5,7 +5,7 @@ Central orchestrator for all LEWIS components and services
 
 import asyncio
 import signal
-import threading
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from pathlib import Path
 
@@ -20,6 +20,13 @@ from tools.tool_manager import ToolManager
 from core.extension_manager import ExtensionManager
 from utils.logger import Logger
 
+@dataclass
+class StatusReport:
+    """Component and extension status aggregated in a single pass"""
+    components: Dict[str, Any]
+    extensions_summary: Dict[str, int]
+    extension_details: Dict[str, Dict[str, Any]]
+
 class LewisCore:
     """
     Main LEWIS system orchestrator
@@ -87,6 +94,10 @@ class LewisCore:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
     
+    async def initialize(self):
+        """Run the asynchronous setup of the components"""
+        await self.knowledge_base.initialize()
+    
     async def process_command(self, user_input: str, user_id: str = "default") -> Dict[str, Any]:
         """
         Process a user command through the LEWIS pipeline
@@ -175,6 +186,34 @@ class LewisCore:
             }
         }
     
+    def get_status_report(self) -> StatusReport:
+        """Get component status together with per-extension details"""
+        extension_details = {}
+        total_commands = 0
+        total_tools = 0
+        for name, extension in self.extension_manager.extensions.items():
+            info = extension.get_info()
+            extension_details[name] = info
+            total_commands += len(info.get("commands", []))
+            total_tools += len(info.get("tools", []))
+        
+        return StatusReport(
+            components={
+                "ai_engine": self.ai_engine.is_ready(),
+                "nlp_processor": self.nlp_processor.is_ready(),
+                "database": self.db_manager.is_connected(),
+                "tools": self.tool_manager.get_available_tools_count(),
+                "learning_engine": self.learning_engine.is_active(),
+                "extensions": len(extension_details)
+            },
+            extensions_summary={
+                "loaded": len(extension_details),
+                "commands": total_commands,
+                "tools": total_tools
+            },
+            extension_details=extension_details
+        )
+    
     def start(self):
         """Start LEWIS system"""
         try:
@@ -249,13 +288,9 @@ class LewisCore:
             }
     
     def _start_background_services(self):
-        """Start background services in separate threads"""
+        """Start background services (on the running event loop when there is one)"""
         if self.settings.get("learning.enabled", True):
-            learning_thread = threading.Thread(
-                target=self.learning_engine.start_background_learning,
-                daemon=True
-            )
-            learning_thread.start()
+            self.learning_engine.start_background_learning()
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
@@ -4,9 +4,18 @@ Provides command-line interface with optional voice support
 """
 
 import asyncio
+import concurrent.futures
+import importlib.util
+import os
+import re
 import sys
-from typing import Optional
-from rich.console import Console
+import threading
+import time
+from collections import deque
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Optional
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.prompt import Prompt
@@ -15,11 +24,62 @@ from rich.live import Live
 from rich.spinner import Spinner
 
 try:
-    import speech_recognition as sr
-    import pyttsx3
-    VOICE_AVAILABLE = True
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.history import FileHistory
+    PROMPT_TOOLKIT_AVAILABLE = True
 except ImportError:
-    VOICE_AVAILABLE = False
+    PROMPT_TOOLKIT_AVAILABLE = False
+
+# Voice dependencies are heavy to import, so they are only probed here and
+# imported when voice is actually initialized
+VOICE_AVAILABLE = None
+
+LEWIS_ASCII_ART = """
+        ██╗     ███████╗██╗    ██╗██╗███████╗
+        ██║     ██╔════╝██║    ██║██║██╔════╝
+        ██║     █████╗  ██║ █╗ ██║██║███████╗
+        ██║     ██╔══╝  ██║███╗██║██║╚════██║
+        ███████╗███████╗╚███╔███╔╝██║███████║
+        ╚══════╝╚══════╝ ╚══╝╚══╝ ╚═╝╚══════╝
+        """
+
+CORE_COMMANDS = [
+    ("scan <target>", "Perform network scan"),
+    ("vuln <target>", "Vulnerability assessment"),
+    ("info <target>", "Gather information"),
+    ("report", "Generate security report"),
+    ("help", "Show this help message"),
+    ("extensions", "List loaded extensions"),
+    ("extensions --page <n>", "Show page n of the loaded extensions"),
+    ("extensions --commands-page <n>", "Show page n of the extension commands"),
+    ("reload-extensions", "Reload all extensions"),
+    ("voice", "Toggle voice mode (if available)"),
+    ("status", "Show system status"),
+    ("exit/quit", "Exit LEWIS")
+]
+
+CORE_COMMAND_WORDS = frozenset(cmd.split()[0] for cmd, _ in CORE_COMMANDS)
+
+# Symbols and Rich markup that should not be read aloud
+TTS_STRIP_TABLE = str.maketrans("", "", "🤖✅❌⚠️🎤🔊📦🛡️💡📋🔄")
+RICH_MARKUP_PATTERN = re.compile(r"\[/?[a-z ]+\]")
+
+# Silero VAD expects 512-sample (32 ms) frames at 16 kHz
+VAD_SAMPLE_RATE = 16000
+VAD_CHUNK_SAMPLES = 512
+VAD_CHUNK_MS = VAD_CHUNK_SAMPLES * 1000 // VAD_SAMPLE_RATE
+VAD_SPEECH_THRESHOLD = 0.5
+VAD_END_SILENCE_MS = 700
+VAD_PRE_ROLL_CHUNKS = 10
+VAD_BARGE_IN_CHUNKS = 8
+
+class VoiceState(Enum):
+    """Voice interaction states for the CLI"""
+    IDLE = "idle"
+    LISTENING = "listening"
+    PROCESSING = "processing"
+    SPEAKING = "speaking"
 
 class CLIInterface:
     """
@@ -30,7 +90,7 @@ class CLIInterface:
     def __init__(self, lewis_core, voice_enabled: bool = False):
         self.lewis = lewis_core
         self.console = Console()
-        self.voice_enabled = voice_enabled and VOICE_AVAILABLE
+        self.voice_enabled = voice_enabled and self._probe_voice()
         
         # Initialize voice components
         if self.voice_enabled:
@@ -40,12 +100,113 @@ class CLIInterface:
         self.user_id = "cli_user"
         self.session_active = True
         
+        # Short-lived cache of core status lookups: key -> (timestamp, value)
+        self._status_cache = {}
+        
+        # Static renderables are built once and reprinted on demand
+        self._build_static_renderables()
+        
+        # Input session with persistent history and command completion
+        self._session = None
+        
+        # Event loop reused for every command instead of asyncio.run per call,
+        # with blocking voice I/O pushed onto a shared worker pool
+        self._loop = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="lewis-cli"
+        )
+        self._speech_future = None
+        
+    def _build_static_renderables(self):
+        """Build the welcome banner and core help tables"""
+        welcome_text = Text()
+        welcome_text.append("Linux Environment Working Intelligence System\n", style="bold cyan")
+        welcome_text.append("AI-Powered Cybersecurity Assistant", style="italic blue")
+        
+        panel = Panel(
+            welcome_text,
+            title="🚀 LEWIS v1.0",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+        
+        self._welcome_renderable = Group(Text(LEWIS_ASCII_ART, style="cyan"), panel)
+        self._help_table = self._build_help_table(include_voice=False)
+        self._voice_help_table = self._build_help_table(include_voice=True)
+    
+    def _build_help_table(self, include_voice: bool) -> Table:
+        """Build the core commands help table"""
+        help_table = Table(title="Core Commands", show_header=True, header_style="bold blue")
+        help_table.add_column("Command", style="yellow")
+        help_table.add_column("Description", style="white")
+        
+        for cmd, desc in CORE_COMMANDS:
+            help_table.add_row(cmd, desc)
+        
+        if include_voice:
+            help_table.add_row("voice input", "Say 'Lewis' followed by your command")
+        
+        return help_table
+    
+    def _get_cached(self, key: str, fn: Callable[[], Any], ttl: float = 2.0) -> Any:
+        """Return a cached core lookup, refreshing it once older than ttl seconds"""
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        value = fn()
+        self._status_cache[key] = (now, value)
+        return value
+    
+    def _get_status_report(self):
+        """Get (cached) aggregated status report from the core"""
+        return self._get_cached("status_report", self.lewis.get_status_report)
+    
+    def _get_extension_status(self) -> dict:
+        """Get (cached) extension status from the core"""
+        return self._get_cached("extension_status", self.lewis.get_extension_status)
+    
+    def _get_available_commands(self) -> dict:
+        """Get (cached) available commands from the core"""
+        return self._get_cached("available_commands", self.lewis.get_available_commands)
+    
+    @classmethod
+    def _probe_voice(cls) -> bool:
+        """Check whether voice dependencies are installed without importing them"""
+        global VOICE_AVAILABLE
+        if VOICE_AVAILABLE is None:
+            VOICE_AVAILABLE = all(
+                importlib.util.find_spec(module) is not None
+                for module in ("speech_recognition", "pyttsx3")
+            )
+        return VOICE_AVAILABLE
+    
     def _initialize_voice(self):
         """Initialize voice recognition and synthesis"""
         try:
+            import speech_recognition as sr
+            import pyttsx3
+            self._sr = sr
+            
+            self.voice_state = VoiceState.IDLE
+            self._barge_in = threading.Event()
+            self._tts_lock = threading.Lock()
+            self.vad_model = self._load_vad_model()
+            # Whisper weights are loaded on the first transcription
+            self._asr_model = None
+            self._asr_loaded = False
+            self._asr_lock = threading.Lock()
+            
             self.recognizer = sr.Recognizer()
-            self.microphone = sr.Microphone()
+            if self.vad_model is not None:
+                self.microphone = sr.Microphone(
+                    sample_rate=VAD_SAMPLE_RATE, chunk_size=VAD_CHUNK_SAMPLES
+                )
+            else:
+                self.microphone = sr.Microphone()
             self.tts_engine = pyttsx3.init()
+            self.tts_engine.connect('started-word', self._on_tts_word)
             
             # Configure TTS
             self.tts_engine.setProperty('rate', 150)
@@ -54,6 +215,17 @@ class CLIInterface:
             # Adjust for ambient noise
             with self.microphone as source:
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            
+            # Pin the calibrated threshold and shorten the silent tail
+            # the recognizer waits for before returning audio
+            voice_config = self.lewis.settings.get("voice", {})
+            energy_threshold = voice_config.get("energy_threshold")
+            if energy_threshold:
+                self.recognizer.energy_threshold = energy_threshold
+            self.recognizer.dynamic_energy_threshold = False
+            self.recognizer.pause_threshold = voice_config.get("pause_threshold", 0.5)
+            self.recognizer.non_speaking_duration = voice_config.get("non_speaking_duration", 0.3)
+            self.recognizer.phrase_threshold = voice_config.get("phrase_threshold", 0.2)
                 
             self.console.print("🎤 Voice interface initialized", style="green")
             
@@ -61,6 +233,122 @@ class CLIInterface:
             self.console.print(f"⚠️  Voice initialization failed: {e}", style="yellow")
             self.voice_enabled = False
     
+    def _load_vad_model(self):
+        """Load the Silero VAD model, or None to fall back to timeout-based listening"""
+        if not self.lewis.settings.get("voice", {}).get("vad_enabled", True):
+            return None
+        
+        try:
+            # The pinned silero-vad package ships its weights, so nothing is
+            # fetched from GitHub at runtime
+            from silero_vad import load_silero_vad
+            return load_silero_vad()
+        except Exception as e:
+            self.console.print(f"⚠️  Silero VAD unavailable, using timeout-based listening: {e}", style="yellow")
+            return None
+    
+    def _load_asr_model(self):
+        """Load a local faster-whisper model, or None to fall back to Google ASR"""
+        voice_config = self.lewis.settings.get("voice", {})
+        model_name = voice_config.get("asr_model", "base.en")
+        if not model_name:
+            return None
+        
+        try:
+            from faster_whisper import WhisperModel
+            return WhisperModel(
+                model_name,
+                device=voice_config.get("asr_device", "cpu"),
+                compute_type=voice_config.get("asr_compute_type", "int8")
+            )
+        except Exception as e:
+            self.console.print(f"⚠️  Local Whisper unavailable, using Google speech API: {e}", style="yellow")
+            return None
+    
+    def _get_asr_model(self):
+        """Return the local Whisper model, loading it on first use"""
+        with self._asr_lock:
+            if not self._asr_loaded:
+                self._asr_model = self._load_asr_model()
+                self._asr_loaded = True
+            return self._asr_model
+    
+    def _transcribe(self, audio) -> str:
+        """Transcribe captured audio, preferring the local Whisper model"""
+        asr_model = self._get_asr_model()
+        if asr_model is None:
+            return self.recognizer.recognize_google(audio)
+        
+        import numpy as np
+        pcm = audio.get_raw_data(convert_rate=VAD_SAMPLE_RATE, convert_width=2)
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = asr_model.transcribe(samples, beam_size=1, vad_filter=True)
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise self._sr.UnknownValueError()
+        return text
+    
+    def _is_speech(self, chunk: bytes, sample_rate: int) -> bool:
+        """Run one 32 ms PCM frame through the VAD model"""
+        import torch
+        samples = torch.frombuffer(bytearray(chunk), dtype=torch.int16).float() / 32768.0
+        return self.vad_model(samples, sample_rate).item() >= VAD_SPEECH_THRESHOLD
+    
+    def _listen_with_vad(self, source, timeout: float = 5, phrase_time_limit: float = 10):
+        """Capture one utterance, ending it after VAD_END_SILENCE_MS of silence"""
+        self.vad_model.reset_states()
+        self.voice_state = VoiceState.LISTENING
+        
+        pre_roll = deque(maxlen=VAD_PRE_ROLL_CHUNKS)
+        frames = []
+        silence_ms = 0
+        started_at = time.monotonic()
+        
+        while True:
+            chunk = source.stream.read(source.CHUNK)
+            speech = self._is_speech(chunk, source.SAMPLE_RATE)
+            
+            if not frames:
+                if speech:
+                    frames.extend(pre_roll)
+                    frames.append(chunk)
+                else:
+                    pre_roll.append(chunk)
+                    if time.monotonic() - started_at > timeout:
+                        self.voice_state = VoiceState.IDLE
+                        raise self._sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                continue
+            
+            frames.append(chunk)
+            silence_ms = 0 if speech else silence_ms + VAD_CHUNK_MS
+            if silence_ms >= VAD_END_SILENCE_MS or len(frames) * VAD_CHUNK_MS >= phrase_time_limit * 1000:
+                break
+        
+        self.voice_state = VoiceState.PROCESSING
+        return self._sr.AudioData(b"".join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+    
+    def _watch_for_barge_in(self):
+        """Listen while speaking and flag sustained user speech as an interruption"""
+        speech_chunks = 0
+        try:
+            with self.microphone as source:
+                while self.voice_state is VoiceState.SPEAKING:
+                    chunk = source.stream.read(source.CHUNK)
+                    if not self._is_speech(chunk, source.SAMPLE_RATE):
+                        speech_chunks = 0
+                        continue
+                    speech_chunks += 1
+                    if speech_chunks >= VAD_BARGE_IN_CHUNKS:
+                        self._barge_in.set()
+                        return
+        except Exception:
+            pass  # Barge-in is best effort
+    
+    def _on_tts_word(self, name, location, length):
+        """Stop speaking once the user has interrupted"""
+        if self._barge_in.is_set():
+            self.tts_engine.stop()
+    
     def start(self):
         """Start the CLI interface"""
         try:
@@ -71,32 +359,25 @@ class CLIInterface:
             self._display_goodbye()
         except Exception as e:
             self.console.print(f"❌ CLI Error: {e}", style="red")
+        finally:
+            self._shutdown_workers()
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the session event loop, creating it on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(self._executor)
+        return self._loop
+    
+    def _shutdown_workers(self):
+        """Stop the worker pool and close the session event loop"""
+        self._executor.shutdown(wait=False)
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
     
     def _display_welcome(self):
         """Display welcome message and system info"""
-        # ASCII Art for LEWIS
-        ascii_art = """
-        ██╗     ███████╗██╗    ██╗██╗███████╗
-        ██║     ██╔════╝██║    ██║██║██╔════╝
-        ██║     █████╗  ██║ █╗ ██║██║███████╗
-        ██║     ██╔══╝  ██║███╗██║██║╚════██║
-        ███████╗███████╗╚███╔███╔╝██║███████║
-        ╚══════╝╚══════╝ ╚══╝╚══╝ ╚═╝╚══════╝
-        """
-        
-        welcome_text = Text()
-        welcome_text.append("Linux Environment Working Intelligence System\n", style="bold cyan")
-        welcome_text.append("AI-Powered Cybersecurity Assistant", style="italic blue")
-        
-        panel = Panel(
-            welcome_text,
-            title="🚀 LEWIS v1.0",
-            border_style="cyan",
-            padding=(1, 2)
-        )
-        
-        self.console.print(ascii_art, style="cyan")
-        self.console.print(panel)
+        self.console.print(self._welcome_renderable)
         
         # Display system status
         self._display_system_status()
@@ -106,15 +387,14 @@ class CLIInterface:
         
     def _display_system_status(self):
         """Display current system status"""
-        status = self.lewis.get_system_status()
+        report = self._get_status_report()
         
         status_table = Table(title="System Status", show_header=True, header_style="bold magenta")
         status_table.add_column("Component", style="cyan")
         status_table.add_column("Status", style="green")
         status_table.add_column("Details", style="white")
         
-        components = status.get("components", {})
-        for component, is_ready in components.items():
+        for component, is_ready in report.components.items():
             status_emoji = "✅" if is_ready else "❌"
             status_text = "Ready" if is_ready else "Not Ready"
             
@@ -139,63 +419,37 @@ class CLIInterface:
         
         self.console.print(status_table)
         
-        # Display extension status if available
-        try:
-            extension_status = self.lewis.get_extension_status()
-            if extension_status and extension_status.get("loaded_extensions"):
-                ext_table = Table(title="Loaded Extensions", show_header=True, header_style="bold blue")
-                ext_table.add_column("Extension", style="yellow")
-                ext_table.add_column("Version", style="cyan")
-                ext_table.add_column("Commands", style="green")
-                
-                for ext_name, ext_info in extension_status["loaded_extensions"].items():
-                    commands = ext_info.get("commands", [])
-                    command_count = len(commands) if commands else 0
-                    ext_table.add_row(
-                        ext_name,
-                        ext_info.get("version", "Unknown"),
-                        str(command_count)
-                    )
-                
-                self.console.print(ext_table)
-        except:
-            pass  # Extension status not available
+        # Display extension details from the same report
+        if report.extension_details:
+            ext_table = Table(title="Loaded Extensions", show_header=True, header_style="bold blue")
+            ext_table.add_column("Extension", style="yellow")
+            ext_table.add_column("Version", style="cyan")
+            ext_table.add_column("Commands", style="green")
+            
+            for ext_name, ext_info in report.extension_details.items():
+                ext_table.add_row(
+                    ext_name,
+                    ext_info.get("version", "Unknown"),
+                    str(len(ext_info.get("commands", [])))
+                )
+            
+            self.console.print(ext_table)
         
         self.console.print()
         
     def _display_help(self):
         """Display available commands and help"""
-        help_table = Table(title="Core Commands", show_header=True, header_style="bold blue")
-        help_table.add_column("Command", style="yellow")
-        help_table.add_column("Description", style="white")
-        
-        commands = [
-            ("scan <target>", "Perform network scan"),
-            ("vuln <target>", "Vulnerability assessment"),
-            ("info <target>", "Gather information"),
-            ("report", "Generate security report"),
-            ("help", "Show this help message"),
-            ("extensions", "List loaded extensions"),
-            ("reload-extensions", "Reload all extensions"),
-            ("voice", "Toggle voice mode (if available)"),
-            ("status", "Show system status"),
-            ("exit/quit", "Exit LEWIS")
-        ]
-        
-        for cmd, desc in commands:
-            help_table.add_row(cmd, desc)
-        
         if self.voice_enabled:
-            help_table.add_row("voice input", "Say 'Lewis' followed by your command")
-        
-        self.console.print(help_table)
+            self.console.print(self._voice_help_table)
+        else:
+            self.console.print(self._help_table)
         
         # Display extension commands if available
         try:
-            available_commands = self.lewis.get_available_commands()
+            available_commands = self._get_available_commands()
             extension_commands = {
                 cmd: desc for cmd, desc in available_commands.items()
-                if "extension" in desc.lower() or cmd not in [c[0].split()[0] for c in commands]
+                if "extension" in desc.lower() or cmd not in CORE_COMMAND_WORDS
             }
             
             if extension_commands:
@@ -249,11 +503,34 @@ class CLIInterface:
                 return self._get_voice_input()
             
             # Get text input
+            if PROMPT_TOOLKIT_AVAILABLE:
+                if self._session is None:
+                    self._session = self._create_prompt_session()
+                if self._session is not None:
+                    return self._session.prompt(f"{mode_indicator} LEWIS > ")
+            
             return Prompt.ask(f"[bold cyan]{mode_indicator} LEWIS[/bold cyan]", default="")
             
         except (EOFError, KeyboardInterrupt):
             return "exit"
     
+    def _create_prompt_session(self):
+        """Create the prompt_toolkit session used for text input"""
+        try:
+            command_words = set(CORE_COMMAND_WORDS)
+            command_words.update(["exit", "quit", "clear"])
+            try:
+                command_words.update(self._get_available_commands())
+            except Exception:
+                pass  # Complete core commands only
+            
+            return PromptSession(
+                history=FileHistory(os.path.expanduser("~/.lewis_history")),
+                completer=WordCompleter(sorted(command_words), ignore_case=True)
+            )
+        except Exception:
+            return None
+    
     def _check_for_voice_activation(self) -> bool:
         """Check if user wants to use voice input"""
         # This could be enhanced to listen for wake word
@@ -262,26 +539,42 @@ class CLIInterface:
     def _get_voice_input(self) -> str:
         """Get voice input from user"""
         try:
-            self.console.print("🎤 Listening... (speak now)", style="yellow")
+            loop = self._get_loop()
             
-            with self.microphone as source:
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+            # Let the previous response finish (or be interrupted) so the
+            # microphone is free
+            if self._speech_future is not None:
+                loop.run_until_complete(self._speech_future)
+                self._speech_future = None
+            
+            self.console.print("🎤 Listening... (speak now)", style="yellow")
+            audio = loop.run_until_complete(loop.run_in_executor(None, self._capture_audio))
             
             self.console.print("🔄 Processing speech...", style="blue")
-            text = self.recognizer.recognize_google(audio)
+            self.voice_state = VoiceState.PROCESSING
+            text = self._transcribe(audio)
             
             self.console.print(f"🎤 You said: [italic]{text}[/italic]")
             return text
             
-        except sr.WaitTimeoutError:
+        except self._sr.WaitTimeoutError:
             self.console.print("⏰ No speech detected", style="yellow")
             return ""
-        except sr.UnknownValueError:
+        except self._sr.UnknownValueError:
             self.console.print("❓ Could not understand speech", style="yellow")
             return ""
         except Exception as e:
             self.console.print(f"🎤 Voice input error: {e}", style="red")
             return ""
+        finally:
+            self.voice_state = VoiceState.IDLE
+    
+    def _capture_audio(self):
+        """Record one utterance from the microphone"""
+        with self.microphone as source:
+            if self.vad_model is not None:
+                return self._listen_with_vad(source, timeout=5, phrase_time_limit=10)
+            return self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
     
     def _handle_special_commands(self, user_input: str) -> bool:
         """Handle special CLI commands"""
@@ -299,8 +592,14 @@ class CLIInterface:
             self._display_system_status()
             return True
         
-        elif cmd == "extensions":
-            self._display_extensions()
+        elif cmd == "extensions" or cmd.startswith("extensions --"):
+            # Each table pages on its own flag: --page and --commands-page
+            pages = {"--page": 1, "--commands-page": 1}
+            parts = cmd.split()[1:]
+            for flag, value in zip(parts[::2], parts[1::2]):
+                if flag in pages and value.isdigit():
+                    pages[flag] = max(int(value), 1)
+            self._display_extensions(pages["--page"], pages["--commands-page"])
             return True
         
         elif cmd == "reload-extensions":
@@ -308,7 +607,7 @@ class CLIInterface:
             return True
         
         elif cmd == "voice":
-            if VOICE_AVAILABLE:
+            if self._probe_voice():
                 self.voice_enabled = not self.voice_enabled
                 status = "enabled" if self.voice_enabled else "disabled"
                 self.console.print(f"🎤 Voice mode {status}", style="green")
@@ -326,10 +625,14 @@ class CLIInterface:
     
     def _process_command(self, user_input: str):
         """Process user command through LEWIS"""
-        # Show processing indicator
-        with Live(Spinner("dots", text="Processing..."), console=self.console):
-            # Run async command processing
-            result = asyncio.run(self.lewis.process_command(user_input, self.user_id))
+        self._get_loop().run_until_complete(self._process_command_async(user_input))
+    
+    async def _process_command_async(self, user_input: str):
+        """Run a command on the CLI event loop behind a processing spinner"""
+        # A spinner needs few frames; a low refresh rate keeps the render
+        # thread from contending with the loop
+        with Live(Spinner("dots", text="Processing..."), console=self.console, refresh_per_second=4):
+            result = await self.lewis.process_command(user_input, self.user_id)
         
         # Display result
         self._display_result(result)
@@ -344,71 +647,87 @@ class CLIInterface:
         ai_response = result.get("ai_response", {})
         response_text = ai_response.get("text", "No response generated")
         
-        # Create response panel
-        response_panel = Panel(
+        # Collect everything into one renderable so the result is written
+        # to the terminal in a single print
+        renderables = [Panel(
             response_text,
             title="🤖 LEWIS Response",
             border_style="green",
             padding=(1, 2)
-        )
-        self.console.print(response_panel)
-        
-        # Speak response if voice is enabled
-        if self.voice_enabled and response_text:
-            self._speak_response(response_text)
+        )]
         
         # Display suggestions if available
         suggestions = ai_response.get("suggestions", [])
         if suggestions:
-            self._display_suggestions(suggestions)
+            renderables.append(self._build_suggestions(suggestions))
         
         # Display execution results if available
         execution = result.get("execution")
         if execution:
-            self._display_execution_result(execution)
+            renderables.extend(self._build_execution_result(execution))
+        
+        self.console.print(Group(*renderables))
+        
+        # Speak response in the background so the next prompt is not blocked
+        if self.voice_enabled and response_text:
+            self._speech_future = self._get_loop().run_in_executor(
+                None, self._speak_response, response_text
+            )
     
-    def _display_suggestions(self, suggestions: list):
-        """Display command suggestions"""
-        if not suggestions:
-            return
-            
+    def _build_suggestions(self, suggestions: list) -> Table:
+        """Build the command suggestions table"""
         suggestion_table = Table(title="💡 Suggestions", show_header=False)
         suggestion_table.add_column("Command", style="cyan")
         
         for suggestion in suggestions[:5]:  # Show max 5 suggestions
             suggestion_table.add_row(f"• {suggestion}")
         
-        self.console.print(suggestion_table)
+        return suggestion_table
     
-    def _display_execution_result(self, execution: dict):
-        """Display command execution results"""
-        if execution.get("success"):
-            self.console.print("✅ Command executed successfully", style="green")
-            
-            output = execution.get("output", "")
-            if output:
-                output_panel = Panel(
-                    output[:1000] + ("..." if len(output) > 1000 else ""),
-                    title="📋 Command Output",
-                    border_style="blue"
-                )
-                self.console.print(output_panel)
-        else:
+    def _build_execution_result(self, execution: dict) -> list:
+        """Build renderables for command execution results"""
+        if not execution.get("success"):
             error = execution.get("error", "Unknown execution error")
-            self.console.print(f"❌ Execution failed: {error}", style="red")
+            return [Text(f"❌ Execution failed: {error}", style="red")]
+        
+        renderables = [Text("✅ Command executed successfully", style="green")]
+        
+        output = execution.get("output", "")
+        if output:
+            renderables.append(Panel(
+                output[:1000] + ("..." if len(output) > 1000 else ""),
+                title="📋 Command Output",
+                border_style="blue"
+            ))
+        return renderables
     
     def _speak_response(self, text: str):
         """Speak the response using TTS"""
+        watcher = None
         try:
             # Clean text for TTS
-            clean_text = text.replace("🤖", "").replace("✅", "").replace("❌", "")
+            clean_text = RICH_MARKUP_PATTERN.sub("", text.translate(TTS_STRIP_TABLE))
             clean_text = clean_text[:200]  # Limit length
             
-            self.tts_engine.say(clean_text)
-            self.tts_engine.runAndWait()
+            self.voice_state = VoiceState.SPEAKING
+            self._barge_in.clear()
+            if self.vad_model is not None:
+                watcher = self._executor.submit(self._watch_for_barge_in)
+            
+            with self._tts_lock:
+                self.tts_engine.say(clean_text)
+                self.tts_engine.runAndWait()
+            
+            if self._barge_in.is_set():
+                self.console.print("🎤 Interrupted", style="yellow")
             
         except Exception as e:
             self.console.print(f"🔊 TTS Error: {e}", style="yellow")
+        finally:
+            self.voice_state = VoiceState.IDLE
+            # Release the microphone before the next listen
+            if watcher is not None:
+                concurrent.futures.wait([watcher], timeout=1)
     
     def _display_goodbye(self):
         """Display goodbye message"""
@@ -419,10 +738,25 @@ class CLIInterface:
         )
         self.console.print(goodbye_panel)
     
-    def _display_extensions(self):
-        """Display detailed extension information"""
+    def _page_bounds(self, total: int, page: int) -> tuple:
+        """Return the (start, end) slice of rows that fit on one terminal page"""
+        page_size = max(self.console.size.height - 6, 10)
+        start = min((page - 1) * page_size, max(total - 1, 0))
+        start -= start % page_size
+        return start, min(start + page_size, total)
+    
+    def _print_page_footer(self, start: int, end: int, total: int, flag: str = "--page"):
+        """Print the pagination footer for a paged table"""
+        if end - start < total:
+            footer = f"Showing {start + 1}–{end} of {total}"
+            if end < total:
+                footer += f" (extensions {flag} {end // (end - start) + 1} for more)"
+            self.console.print(footer, style="dim")
+    
+    def _display_extensions(self, page: int = 1, commands_page: int = 1):
+        """Display detailed extension information, paging each table independently"""
         try:
-            extension_status = self.lewis.get_extension_status()
+            extension_status = self._get_extension_status()
             
             if not extension_status or not extension_status.get("loaded_extensions"):
                 self.console.print("📦 No extensions loaded", style="yellow")
@@ -433,9 +767,16 @@ class CLIInterface:
             overview_table.add_column("Metric", style="yellow")
             overview_table.add_column("Value", style="white")
             
+            # Totals and the set of extension commands in a single pass
             total_extensions = len(extension_status["loaded_extensions"])
-            total_commands = sum(len(ext.get("commands", [])) for ext in extension_status["loaded_extensions"].values())
-            total_tools = sum(len(ext.get("tools", [])) for ext in extension_status["loaded_extensions"].values())
+            total_commands = 0
+            total_tools = 0
+            ext_cmd_set = set()
+            for ext in extension_status["loaded_extensions"].values():
+                ext_commands = ext.get("commands", [])
+                total_commands += len(ext_commands)
+                total_tools += len(ext.get("tools", []))
+                ext_cmd_set.update(ext_commands)
             
             overview_table.add_row("Total Extensions", str(total_extensions))
             overview_table.add_row("Total Commands", str(total_commands))
@@ -452,7 +793,10 @@ class CLIInterface:
             ext_table.add_column("Commands", style="blue")
             ext_table.add_column("Tools", style="magenta")
             
-            for ext_name, ext_info in extension_status["loaded_extensions"].items():
+            # Only build rows for the requested page
+            start, end = self._page_bounds(total_extensions, page)
+            visible_extensions = islice(extension_status["loaded_extensions"].items(), start, end)
+            for ext_name, ext_info in visible_extensions:
                 commands = ext_info.get("commands", [])
                 tools = ext_info.get("tools", [])
                 status = "✅ Active" if ext_info.get("active", True) else "❌ Inactive"
@@ -466,12 +810,13 @@ class CLIInterface:
                 )
             
             self.console.print(ext_table)
+            self._print_page_footer(start, end, total_extensions)
             
             # Show available extension commands
-            available_commands = self.lewis.get_available_commands()
+            available_commands = self._get_available_commands()
             extension_commands = {
                 cmd: desc for cmd, desc in available_commands.items()
-                if any(cmd in ext.get("commands", []) for ext in extension_status["loaded_extensions"].values())
+                if cmd in ext_cmd_set
             }
             
             if extension_commands:
@@ -480,10 +825,12 @@ class CLIInterface:
                 cmd_table.add_column("Command", style="yellow")
                 cmd_table.add_column("Description", style="white")
                 
-                for cmd, desc in extension_commands.items():
+                start, end = self._page_bounds(len(extension_commands), commands_page)
+                for cmd, desc in islice(extension_commands.items(), start, end):
                     cmd_table.add_row(cmd, desc)
                 
                 self.console.print(cmd_table)
+                self._print_page_footer(start, end, len(extension_commands), "--commands-page")
             
         except Exception as e:
             self.console.print(f"❌ Error displaying extensions: {e}", style="red")
@@ -499,8 +846,11 @@ class CLIInterface:
             # Load all extensions
             self.lewis.extension_manager.load_all_extensions()
             
+            # Cached status no longer reflects the loaded extensions
+            self._status_cache.clear()
+            
             # Get new status
-            extension_status = self.lewis.get_extension_status()
+            extension_status = self._get_extension_status()
             loaded_count = len(extension_status.get("loaded_extensions", {}))
             
             self.console.print(f"✅ Extensions reloaded successfully! {loaded_count} extensions loaded", style="green")
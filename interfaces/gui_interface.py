@@ -4,24 +4,52 @@ Provides graphical user interface using tkinter and customtkinter
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, messagebox
 import customtkinter as ctk
+import concurrent.futures
 import threading
-import asyncio
-from datetime import datetime
+import time
+from collections import deque
 from typing import Dict, Any, Optional
-import json
 
 # Set appearance mode and theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Chat display is capped; the full transcript stays in chat_history
+MAX_DISPLAY_LINES = 500
+MAX_CHAT_HISTORY = 10000
+CHAT_OLDER_BATCH = 50
+MAX_HISTORY_BYTES = 2_000_000
+MAX_EXECUTION_OUTPUT = 500
+
+SYSTEM_STATUS_HEADER = "LEWIS System Status\n" + "=" * 20 + "\n"
+
+# Status/analytics/extension refreshes run at most once per interval
+REFRESH_DEBOUNCE_MS = 500
+
+# Time (ms) the reload button stays disabled after a reload finishes
+RELOAD_COOLDOWN_MS = 500
+
+# Row height (px) of the shared tree view style
+TREE_ROW_HEIGHT = 22
+
 class LewisGUI:
     """
     Graphical User Interface for LEWIS
     Provides a modern, dark-themed interface for cybersecurity operations
     """
     
+    # Chat colors by message type, applied through text tags
+    _MSG_COLORS = {
+        "user": "#4A9EFF",
+        "assistant": "#00D26A", 
+        "suggestion": "#FFB800",
+        "execution": "#9D4EDD",
+        "error": "#FF4757",
+        "normal": "#FFFFFF"
+    }
+    
     def __init__(self, lewis_core):
         self.lewis = lewis_core
         self.root = None
@@ -34,17 +62,63 @@ class LewisGUI:
         self.tool_tree = None
         self.progress_bar = None
         
-        # Chat history
-        self.chat_history = []
+        # Chat history (full transcript) of (timestamp, sender, message, type)
+        # tuples, and line counts of the displayed messages with their total.
+        # The line limit grows while older messages are paged in so new
+        # messages don't trim them away again
+        self.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
+        self._display_line_counts = deque()
+        self._display_line_total = 0
+        self._display_line_limit = MAX_DISPLAY_LINES
+        self._history_bytes = 0
         
         # Current user
         self.current_user = "gui_user"
         
+        # Chat timestamp format
+        self._ts_fmt = "%H:%M:%S"
+        
+        # Chat autoscroll is coalesced to once per idle cycle
+        self._autoscroll_pending = False
+        
+        # Display titles for component names, reused across refreshes
+        self._component_titles: Dict[str, str] = {}
+        
+        # Extensions tree model as (iid, (text, values)) rows, and the index
+        # of the first row currently inserted in the tree
+        self._ext_model = []
+        self._ext_first = 0
+        
+        # Last fetched extension status, dropped on refresh and reload
+        self._ext_status_cache = None
+        
+        # Extension reload in progress, at most one at a time
+        self._reload_future = None
+        
+        # Pending debounced refreshes: name -> Tk after() id
+        self._pending_refresh: Dict[str, str] = {}
+        
+        # System status lookup shared by callers within the same second:
+        # (one-second bucket, future of its result)
+        self._status_lock = threading.Lock()
+        self._status_lookup = None
+        
+        # Bounded worker pool for blocking work, shared with the event loop
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="lewis-gui"
+        )
+        
+        # Long-lived event loop for command processing, started on first use
+        self._loop = None
+        self._loop_thread = None
+        
     def start(self):
         """Start the GUI application"""
         try:
             self.running = True
             self._create_main_window()
+            self._init_fonts()
+            self._init_styles()
             self._setup_layout()
             self._update_status()
             
@@ -71,12 +145,36 @@ class LewisGUI:
         self.root.grid_columnconfigure(1, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
     
+    def _init_fonts(self):
+        """Create the fonts shared by all widgets once"""
+        self._font_title = ctk.CTkFont(size=24, weight="bold")
+        self._font_header = ctk.CTkFont(size=16, weight="bold")
+        self._font_subheader = ctk.CTkFont(size=14, weight="bold")
+        self._font_bold = ctk.CTkFont(weight="bold")
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=11)
+        self._font_mono = ctk.CTkFont(family="Consolas", size=12)
+        self._font_mono_bold = ctk.CTkFont(family="Consolas", size=12, weight="bold")
+        self._font_mono_small = ctk.CTkFont(family="Consolas", size=11)
+    
+    def _init_styles(self):
+        """Configure the shared ttk style used by all tree views once"""
+        self._ttk_style = ttk.Style(self.root)
+        self._ttk_style.configure("Lewis.Treeview", rowheight=TREE_ROW_HEIGHT, font=("Segoe UI", 10))
+    
     def _setup_layout(self):
         """Setup the main layout"""
-        # Create main frames
-        self._create_sidebar()
-        self._create_main_area()
-        self._create_status_bar()
+        # Keep the window hidden while widgets are placed so it is laid out
+        # and painted once instead of reflowing after every grid/pack call
+        self.root.withdraw()
+        try:
+            # Create main frames
+            self._create_sidebar()
+            self._create_main_area()
+            self._create_status_bar()
+            self.root.update_idletasks()
+        finally:
+            self.root.deiconify()
     
     def _create_sidebar(self):
         """Create sidebar with tools and options"""
@@ -88,14 +186,14 @@ class LewisGUI:
         logo_label = ctk.CTkLabel(
             sidebar_frame, 
             text="🛡️ LEWIS", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font_title
         )
         logo_label.grid(row=0, column=0, padx=20, pady=(20, 10))
         
         subtitle_label = ctk.CTkLabel(
             sidebar_frame, 
             text="AI Cybersecurity Assistant",
-            font=ctk.CTkFont(size=12)
+            font=self._font_body
         )
         subtitle_label.grid(row=1, column=0, padx=20, pady=(0, 20))
         
@@ -103,7 +201,7 @@ class LewisGUI:
         actions_label = ctk.CTkLabel(
             sidebar_frame, 
             text="Quick Actions", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_header
         )
         actions_label.grid(row=2, column=0, padx=20, pady=(20, 10))
         
@@ -147,11 +245,12 @@ class LewisGUI:
         system_label = ctk.CTkLabel(
             system_frame,
             text="System Status",
-            font=ctk.CTkFont(size=14, weight="bold")        )
+            font=self._font_subheader
+        )
         system_label.pack(pady=10)
         
-        self.system_status_text = ctk.CTkTextbox(system_frame, height=100, width=200)
-        self.system_status_text.pack(padx=10, pady=(0, 10))
+        status_panel, self.system_status_text = self._create_text_panel(system_frame, height=6, width=28)
+        status_panel.pack(padx=10, pady=(0, 10))
         
         # Populate system status
         self._populate_system_status()
@@ -163,7 +262,7 @@ class LewisGUI:
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_rowconfigure(0, weight=1)
           # Create tabview for different modes
-        self.tabview = ctk.CTkTabview(main_frame, width=250)
+        self.tabview = ctk.CTkTabview(main_frame, width=250, command=self._on_tab_change)
         self.tabview.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
         
         # Chat tab
@@ -173,11 +272,21 @@ class LewisGUI:
         self.tabview.add("📊 Analytics")
         self.tabview.add("⚙️ Settings")
         
+        # Only the chat tab is built up front; the others are built the
+        # first time they are selected
         self._setup_chat_tab()
-        self._setup_tools_tab()
-        self._setup_extensions_tab()
-        self._setup_analytics_tab()
-        self._setup_settings_tab()
+        self._tab_setup = {
+            "🔧 Tools": self._setup_tools_tab,
+            "🔌 Extensions": self._setup_extensions_tab,
+            "📊 Analytics": self._setup_analytics_tab,
+            "⚙️ Settings": self._setup_settings_tab
+        }
+    
+    def _on_tab_change(self):
+        """Build a tab's contents the first time it is selected"""
+        setup = self._tab_setup.pop(self.tabview.get(), None)
+        if setup:
+            setup()
     
     def _setup_chat_tab(self):
         """Setup chat interface tab"""
@@ -186,12 +295,17 @@ class LewisGUI:
         chat_frame.grid_rowconfigure(0, weight=1)
         
         # Chat display area
-        self.chat_display = ctk.CTkTextbox(
+        chat_panel, self.chat_display = self._create_text_panel(
             chat_frame,
-            height=400,
-            font=ctk.CTkFont(family="Consolas", size=12)
+            height=25,
+            font=self._font_mono
         )
-        self.chat_display.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
+        chat_panel.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
+        
+        self.chat_display.tag_configure("ts", foreground="#8A8A8A")
+        for msg_type, color in self._MSG_COLORS.items():
+            self.chat_display.tag_configure(f"sender_{msg_type}", foreground=color, font=self._font_mono_bold)
+            self.chat_display.tag_configure(f"body_{msg_type}", foreground=color)
         
         # Input area
         input_frame = ctk.CTkFrame(chat_frame)
@@ -202,7 +316,7 @@ class LewisGUI:
             input_frame,
             placeholder_text="Ask LEWIS anything about cybersecurity...",
             height=40,
-            font=ctk.CTkFont(size=12)
+            font=self._font_body
         )
         self.input_entry.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         self.input_entry.bind("<Return>", self._send_message)
@@ -226,6 +340,16 @@ class LewisGUI:
         )
         voice_btn.grid(row=0, column=2, padx=(0, 10), pady=10)
         
+        # Older messages are repainted from chat_history on demand
+        older_btn = ctk.CTkButton(
+            input_frame,
+            text="⬆ Older",
+            command=self._load_older_messages,
+            width=60,
+            height=40
+        )
+        older_btn.grid(row=0, column=3, padx=(0, 10), pady=10)
+        
         # Add welcome message
         self._add_chat_message("LEWIS", "Hello! I'm LEWIS, your AI cybersecurity assistant. How can I help you today?", "assistant")
     
@@ -239,13 +363,37 @@ class LewisGUI:
         tools_header = ctk.CTkLabel(
             tools_frame,
             text="Available Cybersecurity Tools",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_header
         )
         tools_header.grid(row=0, column=0, padx=20, pady=20)
         
         # Tools list
-        self.tools_frame = ctk.CTkScrollableFrame(tools_frame)
-        self.tools_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
+        list_frame = ctk.CTkFrame(tools_frame)
+        list_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(0, weight=1)
+        
+        # Single tree view instead of one frame per tool
+        self.tool_tree = ttk.Treeview(
+            list_frame,
+            columns=("path", "status"),
+            show="tree headings",
+            style="Lewis.Treeview"
+        )
+        
+        self.tool_tree.heading("#0", text="Tool")
+        self.tool_tree.heading("path", text="Path")
+        self.tool_tree.heading("status", text="Available")
+        
+        self.tool_tree.column("#0", width=200)
+        self.tool_tree.column("path", width=300)
+        self.tool_tree.column("status", width=80, anchor="center")
+        
+        tools_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tool_tree.yview)
+        self.tool_tree.configure(yscrollcommand=tools_scrollbar.set)
+        
+        self.tool_tree.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
+        tools_scrollbar.grid(row=0, column=1, sticky="ns", pady=10)
         
         # Populate tools
         self._populate_tools_list()
@@ -260,7 +408,7 @@ class LewisGUI:
         extensions_header = ctk.CTkLabel(
             extensions_frame,
             text="Extension Manager",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_header
         )
         extensions_header.grid(row=0, column=0, padx=20, pady=20)
         
@@ -302,7 +450,8 @@ class LewisGUI:
             list_frame,
             columns=("version", "status", "commands", "tools"),
             show="tree headings",
-            height=15
+            height=15,
+            style="Lewis.Treeview"
         )
         
         # Configure columns
@@ -312,19 +461,23 @@ class LewisGUI:
         self.ext_tree.heading("commands", text="Commands")
         self.ext_tree.heading("tools", text="Tools")
         
+        # Fixed-width columns; only the name column absorbs extra space
         self.ext_tree.column("#0", width=200)
-        self.ext_tree.column("version", width=80)
-        self.ext_tree.column("status", width=80)
-        self.ext_tree.column("commands", width=80)
-        self.ext_tree.column("tools", width=80)
-        
-        # Add scrollbar
-        ext_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.ext_tree.yview)
-        self.ext_tree.configure(yscrollcommand=ext_scrollbar.set)
+        self.ext_tree.column("version", width=80, stretch=False)
+        self.ext_tree.column("status", width=80, stretch=False)
+        self.ext_tree.column("commands", width=80, stretch=False, anchor="center")
+        self.ext_tree.column("tools", width=80, stretch=False, anchor="center")
+        
+        # The tree is virtualized: only the visible window of self._ext_model
+        # is inserted, so the scrollbar is driven from the model
+        self._ext_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self._scroll_extensions)
+        self.ext_tree.bind("<Configure>", lambda event: self._render_extension_window())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.ext_tree.bind(sequence, self._on_extension_wheel)
         
         # Pack tree and scrollbar
         self.ext_tree.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
-        ext_scrollbar.grid(row=0, column=1, sticky="ns", pady=10)
+        self._ext_scrollbar.grid(row=0, column=1, sticky="ns", pady=10)
         
         # Extension details frame
         details_frame = ctk.CTkFrame(extensions_frame)
@@ -333,12 +486,12 @@ class LewisGUI:
         details_label = ctk.CTkLabel(
             details_frame,
             text="Extension Details",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_subheader
         )
         details_label.pack(pady=(10, 5))
         
-        self.ext_details_text = ctk.CTkTextbox(details_frame, height=100)
-        self.ext_details_text.pack(padx=10, pady=(0, 10), fill="x")
+        details_panel, self.ext_details_text = self._create_text_panel(details_frame, height=6)
+        details_panel.pack(padx=10, pady=(0, 10), fill="x")
         
         # Bind tree selection
         self.ext_tree.bind("<<TreeviewSelect>>", self._on_extension_select)
@@ -356,7 +509,7 @@ class LewisGUI:
         analytics_header = ctk.CTkLabel(
             analytics_frame,
             text="System Analytics & Metrics",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_header
         )
         analytics_header.grid(row=0, column=0, padx=20, pady=20)
         
@@ -364,6 +517,13 @@ class LewisGUI:
         self.metrics_frame = ctk.CTkFrame(analytics_frame)
         self.metrics_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
         
+        metrics_panel, self.metrics_display = self._create_text_panel(
+            self.metrics_frame,
+            height=18,
+            font=self._font_mono_small
+        )
+        metrics_panel.pack(fill="both", expand=True, padx=20, pady=20)
+        
         self._populate_analytics()
     
     def _setup_settings_tab(self):
@@ -375,7 +535,7 @@ class LewisGUI:
         settings_header = ctk.CTkLabel(
             settings_frame,
             text="LEWIS Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_header
         )
         settings_header.grid(row=0, column=0, padx=20, pady=20)
         
@@ -388,24 +548,35 @@ class LewisGUI:
         voice_frame = ctk.CTkFrame(parent)
         voice_frame.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
         
-        voice_label = ctk.CTkLabel(voice_frame, text="Voice Settings", font=ctk.CTkFont(weight="bold"))
+        voice_label = ctk.CTkLabel(voice_frame, text="Voice Settings", font=self._font_bold)
         voice_label.pack(pady=10)
         
-        self.voice_enabled = ctk.CTkCheckBox(voice_frame, text="Enable Voice Commands")
+        self._voice_var = tk.BooleanVar(value=bool(self.lewis.settings.get("voice.enabled", False)))
+        self.voice_enabled = ctk.CTkCheckBox(
+            voice_frame,
+            text="Enable Voice Commands",
+            variable=self._voice_var
+        )
         self.voice_enabled.pack(pady=5)
         
         # AI settings
         ai_frame = ctk.CTkFrame(parent)
         ai_frame.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
         
-        ai_label = ctk.CTkLabel(ai_frame, text="AI Settings", font=ctk.CTkFont(weight="bold"))
+        ai_label = ctk.CTkLabel(ai_frame, text="AI Settings", font=self._font_bold)
         ai_label.pack(pady=10)
         
         temperature_label = ctk.CTkLabel(ai_frame, text="AI Temperature:")
         temperature_label.pack(pady=5)
         
-        self.temperature_slider = ctk.CTkSlider(ai_frame, from_=0.1, to=1.0, number_of_steps=9)
-        self.temperature_slider.set(0.7)
+        self._temp_var = tk.DoubleVar(value=float(self.lewis.settings.get("ai.temperature", 0.7)))
+        self.temperature_slider = ctk.CTkSlider(
+            ai_frame,
+            from_=0.1,
+            to=1.0,
+            number_of_steps=9,
+            variable=self._temp_var
+        )
         self.temperature_slider.pack(pady=5)
         
         # Save settings button
@@ -416,6 +587,42 @@ class LewisGUI:
         )
         save_btn.grid(row=3, column=0, padx=20, pady=20)
     
+    def _create_text_panel(self, parent, height, font=None, **text_options):
+        """
+        Create a read-only text panel inside a themed frame
+        
+        Uses a native tk.Text instead of CTkTextbox, whose Canvas-backed
+        rendering is much slower for append-heavy logs. The panel keeps no
+        undo history and is only made writable for the duration of a write.
+        """
+        panel = ctk.CTkFrame(parent)
+        panel.grid_columnconfigure(0, weight=1)
+        panel.grid_rowconfigure(0, weight=1)
+        
+        text = tk.Text(
+            panel,
+            height=height,
+            font=font,
+            bg="#2b2b2b",
+            fg="#ffffff",
+            insertbackground="#ffffff",
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            wrap="word",
+            undo=False,
+            maxundo=0,
+            autoseparators=False,
+            state="disabled",
+            **text_options
+        )
+        scrollbar = ctk.CTkScrollbar(panel, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        
+        text.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        return panel, text
+    
     def _create_status_bar(self):
         """Create status bar at bottom"""
         status_frame = ctk.CTkFrame(self.root, height=30, corner_radius=0)
@@ -425,7 +632,7 @@ class LewisGUI:
         self.status_label = ctk.CTkLabel(
             status_frame,
             text="Ready",
-            font=ctk.CTkFont(size=11)
+            font=self._font_small
         )
         self.status_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         
@@ -435,48 +642,123 @@ class LewisGUI:
         self.progress_bar.set(0)
     
     def _populate_tools_list(self):
-        """Populate the tools list"""
+        """Populate the tools list without blocking the Tk thread"""
+        if not self.tool_tree.get_children():
+            self.tool_tree.insert("", "end", iid="__loading__", text="Loading...", values=("", ""))
+        self._fetch_in_background(self.lewis.get_tool_status, self._apply_tools_list)
+    
+    def _apply_tools_list(self, tool_status, error):
+        """Update the tools tree with fetched tool status"""
+        if error is not None:
+            self._sync_tree(self.tool_tree, {"__error__": (f"Error loading tools: {error}", ("", ""))})
+            return
+        
+        tools = tool_status.get("tools", {})
+        self._sync_tree(self.tool_tree, {
+            tool_name: (
+                tool_name,
+                (status.get("path", "Not found"), "✅" if status.get("available") else "❌")
+            )
+            for tool_name, status in tools.items()
+        })
+    
+    def _sync_tree(self, tree, rows: Dict[str, tuple]):
+        """
+        Patch a Treeview to match rows ({iid: (text, values)}) in order
+        
+        Existing rows are updated in place only when they changed, new rows
+        are inserted and rows that disappeared are deleted, instead of
+        clearing and rebuilding the whole tree. The scrollbar is detached
+        while patching so it is updated once rather than after every row.
+        """
+        yscrollcommand = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand="")
         try:
-            tool_status = self.lewis.get_tool_status()
-            tools = tool_status.get("tools", {})
+            stale = set(tree.get_children()) - rows.keys()
+            if stale:
+                tree.delete(*stale)
             
-            for tool_name, status in tools.items():
-                tool_frame = ctk.CTkFrame(self.tools_frame)
-                tool_frame.pack(fill="x", padx=10, pady=5)
-                
-                # Tool name and status
-                status_icon = "✅" if status.get("available") else "❌"
-                tool_label = ctk.CTkLabel(
-                    tool_frame,
-                    text=f"{status_icon} {tool_name}",
-                    font=ctk.CTkFont(weight="bold")
-                )
-                tool_label.pack(side="left", padx=10, pady=10)
+            for index, (iid, (text, values)) in enumerate(rows.items()):
+                values = tuple(str(value) for value in values)
+                if not tree.exists(iid):
+                    tree.insert("", index, iid=iid, text=text, values=values)
+                    continue
                 
-                # Tool path
-                path_label = ctk.CTkLabel(
-                    tool_frame,
-                    text=status.get("path", "Not found"),
-                    font=ctk.CTkFont(size=10)
-                )
-                path_label.pack(side="left", padx=(0, 10), pady=10)
-                
-        except Exception as e:
-            error_label = ctk.CTkLabel(
-                self.tools_frame,
-                text=f"Error loading tools: {e}",
-                text_color="red"
-            )
-            error_label.pack(padx=10, pady=10)
+                item = tree.item(iid)
+                if item["text"] != text or tuple(str(value) for value in item["values"]) != values:
+                    tree.item(iid, text=text, values=values)
+                if tree.index(iid) != index:
+                    tree.move(iid, "", index)
+        finally:
+            tree.configure(yscrollcommand=yscrollcommand)
     
-    def _populate_analytics(self):
-        """Populate analytics information"""
-        try:
-            status = self.lewis.get_system_status()
-            stats = status.get("stats", {})
+    def _fetch_in_background(self, fetch, apply):
+        """Run fetch on a worker thread and pass (result, error) to apply on the Tk thread"""
+        def worker():
+            try:
+                result, error = fetch(), None
+            except Exception as e:
+                result, error = None, e
             
-            # Create metrics display
-            metrics_text = f"""
+            self._dispatch_to_ui(apply, result, error)
+        
+        self._executor.submit(worker)
+    
+    def _set_text(self, widget, text):
+        """Replace the contents of a read-only text panel"""
+        widget.configure(state="normal")
+        widget.delete("1.0", "end")
+        widget.insert("1.0", text)
+        widget.configure(state="disabled")
+    
+    def _schedule_refresh(self, name: str, callback):
+        """Run callback once after REFRESH_DEBOUNCE_MS, coalescing repeated requests"""
+        if self._pending_refresh.get(name):
+            return
+        
+        def run():
+            self._pending_refresh.pop(name, None)
+            callback()
+        
+        self._pending_refresh[name] = self.root.after(REFRESH_DEBOUNCE_MS, run)
+    
+    def _get_system_status(self) -> Dict[str, Any]:
+        """
+        Get system status, shared by callers within the same second
+        
+        The first caller in a second fetches it; concurrent callers wait on
+        that caller's future instead of querying the core again.
+        """
+        bucket = int(time.monotonic())
+        with self._status_lock:
+            fetch = self._status_lookup is None or self._status_lookup[0] != bucket
+            if fetch:
+                self._status_lookup = (bucket, concurrent.futures.Future())
+            future = self._status_lookup[1]
+        
+        if fetch:
+            try:
+                future.set_result(self.lewis.get_system_status())
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+    
+    def _populate_analytics(self):
+        """Schedule a debounced analytics refresh"""
+        self._schedule_refresh("analytics", self._do_populate_analytics)
+    
+    def _do_populate_analytics(self):
+        """Populate analytics information without blocking the Tk thread"""
+        self._set_text(self.metrics_display, "Loading...")
+        self._fetch_in_background(self._build_analytics_text, self._apply_analytics)
+    
+    def _build_analytics_text(self) -> str:
+        """Format analytics text (runs on a worker thread)"""
+        status = self._get_system_status()
+        stats = status.get("stats", {})
+        
+        # Create metrics display
+        metrics_text = f"""
 System Statistics:
 • Commands Processed: {stats.get('total_commands', 0)}
 • Knowledge Entries: {stats.get('knowledge_entries', 0)}
@@ -485,28 +767,20 @@ System Statistics:
 
 Component Status:
 """
-            
-            components = status.get("components", {})
-            for component, ready in components.items():
-                status_icon = "✅" if ready else "❌"
-                metrics_text += f"• {component.replace('_', ' ').title()}: {status_icon}\n"
-            
-            metrics_display = ctk.CTkTextbox(
-                self.metrics_frame,
-                height=300,
-                font=ctk.CTkFont(family="Consolas", size=11)
-            )
-            metrics_display.pack(fill="both", expand=True, padx=20, pady=20)
-            metrics_display.insert("1.0", metrics_text)
-            metrics_display.configure(state="disabled")
-            
-        except Exception as e:
-            error_label = ctk.CTkLabel(
-                self.metrics_frame,
-                text=f"Error loading analytics: {e}",
-                text_color="red"
-            )
-            error_label.pack(padx=10, pady=10)
+        
+        components = status.get("components", {})
+        for component, ready in components.items():
+            status_icon = "✅" if ready else "❌"
+            metrics_text += f"• {component.replace('_', ' ').title()}: {status_icon}\n"
+        
+        return metrics_text
+    
+    def _apply_analytics(self, metrics_text, error):
+        """Show fetched analytics text"""
+        if error is not None:
+            metrics_text = f"Error loading analytics: {error}"
+        
+        self._set_text(self.metrics_display, metrics_text)
     
     def _send_message(self, event=None):
         """Send message to LEWIS"""
@@ -524,32 +798,41 @@ Component Status:
         self._update_status("Processing command...")
         self.progress_bar.set(0.3)
         
-        # Process command in background thread
-        threading.Thread(
-            target=self._process_command_async,
-            args=(message,),
-            daemon=True
-        ).start()
+        # Process command on the background event loop
+        future = self._run_coroutine(self.lewis.process_command(message, self.current_user))
+        future.add_done_callback(self._on_command_done)
     
-    def _process_command_async(self, message):
-        """Process command asynchronously"""
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Process command
-            result = loop.run_until_complete(
-                self.lewis.process_command(message, self.current_user)
+    def _run_coroutine(self, coro) -> concurrent.futures.Future:
+        """Submit coro to the command event loop, starting the loop thread on first use"""
+        import asyncio
+        
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(self._executor)
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="lewis-gui-loop",
+                daemon=True
             )
-            
-            # Update GUI in main thread
-            self.root.after(0, self._handle_command_result, result)
-            
-        except Exception as e:
-            self.root.after(0, self._handle_command_error, str(e))
-        finally:
-            loop.close()
+            self._loop_thread.start()
+        
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def _on_command_done(self, future):
+        """Hand a finished command back to the Tk thread"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._dispatch_to_ui(self._handle_command_error, str(future.exception()))
+        else:
+            self._dispatch_to_ui(self._handle_command_result, future.result())
+    
+    def _dispatch_to_ui(self, callback, *args):
+        """Schedule callback on the Tk thread from a worker thread"""
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Window already destroyed during shutdown
     
     def _handle_command_result(self, result):
         """Handle command result in main thread"""
@@ -570,7 +853,12 @@ Component Status:
                 # Show execution results if available
                 execution = result.get("execution")
                 if execution and execution.get("success"):
-                    exec_text = f"✅ Command executed successfully\n{execution.get('output', '')[:500]}..."
+                    # Only a bounded excerpt of the output is kept in the chat
+                    output = execution.get("output", "")
+                    excerpt = output[:MAX_EXECUTION_OUTPUT]
+                    if len(output) > MAX_EXECUTION_OUTPUT:
+                        excerpt += "..."
+                    exec_text = f"✅ Command executed successfully\n{excerpt}"
                     self._add_chat_message("LEWIS", exec_text, "execution")
                 
             else:
@@ -591,34 +879,73 @@ Component Status:
     
     def _add_chat_message(self, sender, message, msg_type="normal"):
         """Add message to chat display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Color coding based on message type
-        colors = {
-            "user": "#4A9EFF",
-            "assistant": "#00D26A", 
-            "suggestion": "#FFB800",
-            "execution": "#9D4EDD",
-            "error": "#FF4757",
-            "normal": "#FFFFFF"
-        }
-        
-        color = colors.get(msg_type, colors["normal"])
-        
-        # Format message
-        formatted_message = f"[{timestamp}] {sender}: {message}\n\n"
+        entry = (time.strftime(self._ts_fmt), sender, message, msg_type)
         
         # Add to chat display
-        self.chat_display.insert(tk.END, formatted_message)
+        self.chat_display.configure(state="normal")
+        self._insert_chat_entry(entry)
+        self._trim_chat_display()
+        self.chat_display.configure(state="disabled")
+        if not self._autoscroll_pending:
+            self._autoscroll_pending = True
+            self.root.after_idle(self._flush_autoscroll)
+        
+        # Store in history, keeping its total size under MAX_HISTORY_BYTES
+        if len(self.chat_history) == self.chat_history.maxlen:
+            self._history_bytes -= len(self.chat_history[0][2])
+        self.chat_history.append(entry)
+        self._history_bytes += len(message)
+        while self._history_bytes > MAX_HISTORY_BYTES and len(self.chat_history) > 1:
+            self._history_bytes -= len(self.chat_history.popleft()[2])
+    
+    def _flush_autoscroll(self):
+        """Scroll the chat to the newest message once per batch of inserts"""
+        self._autoscroll_pending = False
         self.chat_display.see(tk.END)
-        
-        # Store in history
-        self.chat_history.append({
-            "timestamp": timestamp,
-            "sender": sender,
-            "message": message,
-            "type": msg_type
-        })
+    
+    def _insert_chat_entry(self, entry):
+        """Insert one history entry at the end of the chat display"""
+        timestamp, sender, message, msg_type = entry
+        if msg_type not in self._MSG_COLORS:
+            msg_type = "normal"
+        
+        # One insert with a tagged segment each for timestamp, sender and body
+        body = f"{message}\n\n"
+        self.chat_display.insert(
+            tk.END,
+            f"[{timestamp}] ", ("ts",),
+            f"{sender}: ", (f"sender_{msg_type}",),
+            body, (f"body_{msg_type}",)
+        )
+        line_count = body.count("\n")
+        self._display_line_counts.append(line_count)
+        self._display_line_total += line_count
+    
+    def _trim_chat_display(self):
+        """Drop the oldest messages once the display exceeds its line limit"""
+        excess = 0
+        while self._display_line_total > self._display_line_limit and len(self._display_line_counts) > 1:
+            removed = self._display_line_counts.popleft()
+            self._display_line_total -= removed
+            excess += removed
+        
+        if excess:
+            self.chat_display.delete("1.0", f"{excess + 1}.0")
+    
+    def _load_older_messages(self):
+        """Repaint the chat display with another batch of older messages"""
+        shown = len(self._display_line_counts) + CHAT_OLDER_BATCH
+        history = list(self.chat_history)[-shown:]
+        
+        self._display_line_counts.clear()
+        self._display_line_total = 0
+        self.chat_display.configure(state="normal")
+        self.chat_display.delete("1.0", tk.END)
+        for entry in history:
+            self._insert_chat_entry(entry)
+        self._display_line_limit = self._display_line_total + MAX_DISPLAY_LINES
+        self.chat_display.configure(state="disabled")
+        self.chat_display.see("1.0")
     
     def _quick_scan(self):
         """Quick network scan"""
@@ -664,18 +991,19 @@ Component Status:
             messagebox.showerror("Voice Error", f"Voice input error: {e}")
     
     def _save_settings(self):
-        """Save settings"""
+        """Apply settings to the running configuration (not written to disk)"""
         try:
             settings = {
-                "voice_enabled": self.voice_enabled.get(),
-                "ai_temperature": self.temperature_slider.get()
+                "voice.enabled": self._voice_var.get(),
+                "ai.temperature": round(self._temp_var.get(), 2)
             }
+            for key, value in settings.items():
+                self.lewis.settings.set(key, value)
             
-            # Save to configuration
-            messagebox.showinfo("Settings", "Settings saved successfully!")
+            messagebox.showinfo("Settings", "Settings applied for this session")
             
         except Exception as e:
-            messagebox.showerror("Settings Error", f"Failed to save settings: {e}")
+            messagebox.showerror("Settings Error", f"Failed to apply settings: {e}")
     
     def _update_status(self, status="Ready"):
         """Update status bar"""
@@ -685,142 +1013,231 @@ Component Status:
     def stop(self):
         """Stop the GUI application"""
         self.running = False
+        self._close_loop()
+        self._executor.shutdown(wait=False)
         if self.root:
             self.root.quit()
             self.root.destroy()
     
-    def _populate_system_status(self):
-        """Populate system status display with current information"""
+    def _close_loop(self):
+        """Stop the command event loop (its executor is shut down by stop())"""
+        if self._loop is None:
+            return
+        
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+        
+        if self._loop.is_running() or self._loop.is_closed():
+            return
+        
         try:
-            # Get system status
-            status = self.lewis.get_system_status()
-            
-            # Format status text
-            status_text = "LEWIS System Status\n"
-            status_text += "=" * 20 + "\n\n"
-            
-            # Components status
-            components = status.get("components", {})
-            status_text += "Core Components:\n"
-            for component, is_ready in components.items():
-                if component == "extensions":
-                    ext_count = is_ready if isinstance(is_ready, int) else 0
-                    status_icon = "✅" if ext_count > 0 else "⚠️"
-                    status_text += f"{status_icon} Extensions: {ext_count} loaded\n"
-                elif component == "tools":
-                    tool_count = is_ready if isinstance(is_ready, int) else 0
-                    status_icon = "✅" if tool_count > 0 else "⚠️"
-                    status_text += f"{status_icon} Tools: {tool_count} available\n"
-                else:
-                    status_icon = "✅" if is_ready else "❌"
-                    comp_name = component.replace("_", " ").title()
-                    status_text += f"{status_icon} {comp_name}: {'Ready' if is_ready else 'Not Ready'}\n"
-            
-            # Stats
-            stats = status.get("stats", {})
-            if stats:
-                status_text += f"\nStatistics:\n"
-                status_text += f"Commands: {stats.get('total_commands', 0)}\n"
-                status_text += f"Knowledge: {stats.get('knowledge_entries', 0)}\n"
-                status_text += f"Users: {stats.get('active_users', 0)}\n"
-            
-            # Extension details
-            try:
-                extension_status = self.lewis.get_extension_status()
-                if extension_status and extension_status.get("loaded_extensions"):
-                    status_text += f"\nLoaded Extensions:\n"
-                    for ext_name, ext_info in extension_status["loaded_extensions"].items():
-                        status_text += f"• {ext_name} v{ext_info.get('version', '?')}\n"
-            except:
-                pass
-            
-            # Update display
-            self.system_status_text.delete("1.0", "end")
-            self.system_status_text.insert("1.0", status_text)
-            
-        except Exception as e:
-            error_text = f"Error loading system status:\n{str(e)}"
-            self.system_status_text.delete("1.0", "end")
-            self.system_status_text.insert("1.0", error_text)
-
-class GUIInterface:
-    """GUI Interface wrapper for LEWIS"""
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            self._loop.close()
     
-    def __init__(self, lewis_core):
-        self.lewis = lewis_core
-        self.gui = None
+    def _populate_system_status(self):
+        """Schedule a debounced system status refresh"""
+        self._schedule_refresh("status", self._do_populate_system_status)
     
-    def start(self):
-        """Start GUI interface"""
+    def _do_populate_system_status(self):
+        """Populate system status display without blocking the Tk thread"""
+        self._set_text(self.system_status_text, "Loading...")
+        self._fetch_in_background(self._build_system_status_text, self._apply_system_status)
+    
+    def _build_system_status_text(self) -> str:
+        """Format system status text (runs on a worker thread)"""
+        # Get system status
+        status = self._get_system_status()
+        
+        # Format status text
+        parts = [SYSTEM_STATUS_HEADER, "Core Components:"]
+        
+        # Components status
+        components = status.get("components", {})
+        for component, is_ready in components.items():
+            if component == "extensions":
+                ext_count = is_ready if isinstance(is_ready, int) else 0
+                status_icon = "✅" if ext_count > 0 else "⚠️"
+                parts.append(f"{status_icon} Extensions: {ext_count} loaded")
+            elif component == "tools":
+                tool_count = is_ready if isinstance(is_ready, int) else 0
+                status_icon = "✅" if tool_count > 0 else "⚠️"
+                parts.append(f"{status_icon} Tools: {tool_count} available")
+            else:
+                status_icon = "✅" if is_ready else "❌"
+                comp_name = self._component_titles.get(component)
+                if comp_name is None:
+                    comp_name = self._component_titles[component] = component.replace("_", " ").title()
+                parts.append(f"{status_icon} {comp_name}: {'Ready' if is_ready else 'Not Ready'}")
+        
+        # Stats
+        stats = status.get("stats", {})
+        if stats:
+            parts.append("\nStatistics:")
+            parts.append(f"Commands: {stats.get('total_commands', 0)}")
+            parts.append(f"Knowledge: {stats.get('knowledge_entries', 0)}")
+            parts.append(f"Users: {stats.get('active_users', 0)}")
+        
+        # Extension details
         try:
-            self.gui = LewisGUI(self.lewis)
-            self.gui.start()
-        except Exception as e:
-            print(f"❌ Failed to start GUI: {e}")
+            extension_status = self._get_extension_status_cached()
+            if extension_status and extension_status.get("loaded_extensions"):
+                parts.append("\nLoaded Extensions:")
+                for ext_name, ext_info in extension_status["loaded_extensions"].items():
+                    parts.append(f"• {ext_name} v{ext_info.get('version', '?')}")
+        except:
+            pass
+        
+        return "\n".join(parts) + "\n"
+    
+    def _apply_system_status(self, status_text, error):
+        """Show fetched system status text"""
+        if error is not None:
+            status_text = f"Error loading system status:\n{str(error)}"
+        
+        self._set_text(self.system_status_text, status_text)
     
-    def stop(self):
-        """Stop GUI interface"""
-        if self.gui:
-            self.gui.stop()
-
     def _reload_extensions_gui(self):
-        """Reload all extensions from GUI"""
+        """Reload all extensions from GUI, ignoring clicks while a reload runs"""
+        if self._reload_future is not None and not self._reload_future.done():
+            return
+        
         try:
             # Update status
             self._update_status("Reloading extensions...")
+            self.reload_ext_btn.configure(state="disabled")
             
-            # Reload extensions in separate thread
+            # Reload extensions on the worker pool
             def reload_thread():
                 try:
                     self.lewis.extension_manager.unload_all_extensions()
                     self.lewis.extension_manager.load_all_extensions()
+                    self._ext_status_cache = None
                     
                     # Update GUI in main thread
                     self.root.after(0, lambda: [
                         self._refresh_extensions_gui(),
                         self._update_status("Extensions reloaded successfully"),
+                        self._end_reload_cooldown(),
                         messagebox.showinfo("Success", "Extensions reloaded successfully!")
                     ])
                 except Exception as e:
-                    self.root.after(0, lambda: [
+                    self.root.after(0, lambda error=e: [
                         self._update_status("Extension reload failed"),
-                        messagebox.showerror("Error", f"Failed to reload extensions: {e}")
+                        self._end_reload_cooldown(),
+                        messagebox.showerror("Error", f"Failed to reload extensions: {error}")
                     ])
             
-            threading.Thread(target=reload_thread, daemon=True).start()
+            self._reload_future = self._executor.submit(reload_thread)
             
         except Exception as e:
+            self.reload_ext_btn.configure(state="normal")
             messagebox.showerror("Error", f"Failed to reload extensions: {e}")
     
+    def _end_reload_cooldown(self):
+        """Re-enable the reload button shortly after a reload finishes"""
+        self.root.after(RELOAD_COOLDOWN_MS, lambda: self.reload_ext_btn.configure(state="normal"))
+    
     def _refresh_extensions_gui(self):
-        """Refresh extensions display"""
+        """Schedule a debounced extensions refresh"""
+        self._schedule_refresh("extensions", self._do_refresh_extensions_gui)
+    
+    def _do_refresh_extensions_gui(self):
+        """Refresh extensions display without blocking the Tk thread"""
+        self._ext_status_cache = None
+        self._fetch_in_background(self._get_extension_status_cached, self._apply_extensions)
+    
+    def _get_extension_status_cached(self) -> Dict[str, Any]:
+        """Get extension status, reusing the last fetch until it is invalidated"""
+        if self._ext_status_cache is None:
+            self._ext_status_cache = self.lewis.get_extension_status()
+        return self._ext_status_cache
+    
+    def _apply_extensions(self, extension_status, error):
+        """Fill the extensions tree with fetched extension status"""
+        if error is not None:
+            print(f"Error refreshing extensions: {error}")
+            return
+        
         try:
-            # Clear existing items
-            for item in self.ext_tree.get_children():
-                self.ext_tree.delete(item)
-            
-            # Get extension status
-            extension_status = self.lewis.get_extension_status()
-            
             if not extension_status or not extension_status.get("loaded_extensions"):
                 # Add "No extensions" item
-                self.ext_tree.insert("", "end", text="No extensions loaded", 
-                                   values=("", "Inactive", "0", "0"))
-                return
+                self._ext_model = [
+                    ("__none__", ("No extensions loaded", ("", "Inactive", "0", "0")))
+                ]
+            else:
+                columns = self._extension_columns(extension_status["loaded_extensions"])
+                self._ext_model = [
+                    (name, (name, (version, status, commands_count, tools_count)))
+                    for name, version, status, commands_count, tools_count in zip(*columns)
+                ]
             
-            # Add extensions to tree
-            for ext_name, ext_info in extension_status["loaded_extensions"].items():
-                commands_count = len(ext_info.get("commands", []))
-                tools_count = len(ext_info.get("tools", []))
-                status = "Active" if ext_info.get("active", True) else "Inactive"
-                version = ext_info.get("version", "Unknown")
-                
-                self.ext_tree.insert("", "end", text=ext_name,
-                                   values=(version, status, commands_count, tools_count))
+            self._render_extension_window()
             
         except Exception as e:
             print(f"Error refreshing extensions: {e}")
     
+    def _extension_columns(self, loaded: Dict[str, Dict[str, Any]]) -> tuple:
+        """
+        Split loaded extension info into per-column tuples
+        
+        Returns (names, versions, statuses, command_counts, tool_counts),
+        each read from the extension dicts in one pass per column.
+        """
+        names = tuple(loaded)
+        infos = tuple(loaded[name] for name in names)
+        return (
+            names,
+            tuple(info.get("version", "Unknown") for info in infos),
+            tuple("Active" if info.get("active", True) else "Inactive" for info in infos),
+            tuple(len(info.get("commands", ())) for info in infos),
+            tuple(len(info.get("tools", ())) for info in infos)
+        )
+    
+    def _visible_extension_rows(self) -> int:
+        """Number of extension rows that fit in the tree's current height"""
+        height = self.ext_tree.winfo_height()
+        if height <= 1:
+            # Not mapped yet, fall back to the requested height in rows
+            return int(self.ext_tree.cget("height"))
+        
+        # One row's worth of space is taken by the headings
+        return max(1, height // TREE_ROW_HEIGHT - 1)
+    
+    def _render_extension_window(self):
+        """Show only the rows of the extension model that are in view"""
+        total = len(self._ext_model)
+        visible = self._visible_extension_rows()
+        self._ext_first = max(0, min(self._ext_first, total - visible))
+        
+        window = self._ext_model[self._ext_first:self._ext_first + visible]
+        self._sync_tree(self.ext_tree, dict(window))
+        
+        if total:
+            self._ext_scrollbar.set(
+                self._ext_first / total,
+                min(1.0, (self._ext_first + visible) / total)
+            )
+        else:
+            self._ext_scrollbar.set(0.0, 1.0)
+    
+    def _scroll_extensions(self, action, amount, unit=None):
+        """Scrollbar command for the virtualized extensions tree"""
+        if action == "moveto":
+            self._ext_first = int(float(amount) * len(self._ext_model))
+        else:
+            step = self._visible_extension_rows() if unit == "pages" else 1
+            self._ext_first += int(amount) * step
+        
+        self._render_extension_window()
+    
+    def _on_extension_wheel(self, event):
+        """Scroll the virtualized extensions tree with the mouse wheel"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self._scroll_extensions("scroll", direction * 3, "units")
+        return "break"
+    
     def _on_extension_select(self, event):
         """Handle extension selection in tree"""
         try:
@@ -832,36 +1249,34 @@ class GUIInterface:
             ext_name = item["text"]
             
             if ext_name == "No extensions loaded":
-                self.ext_details_text.delete("1.0", "end")
-                self.ext_details_text.insert("1.0", "No extensions are currently loaded.")
+                self._set_text(self.ext_details_text, "No extensions are currently loaded.")
                 return
             
             # Get extension details
-            extension_status = self.lewis.get_extension_status()
+            extension_status = self._get_extension_status_cached()
             ext_info = extension_status.get("loaded_extensions", {}).get(ext_name, {})
             
             # Format details
-            details = f"Extension: {ext_name}\n"
-            details += f"Version: {ext_info.get('version', 'Unknown')}\n"
-            details += f"Status: {'Active' if ext_info.get('active', True) else 'Inactive'}\n"
-            details += f"Path: {ext_info.get('path', 'Unknown')}\n\n"
+            parts = [
+                f"Extension: {ext_name}\n",
+                f"Version: {ext_info.get('version', 'Unknown')}\n",
+                f"Status: {'Active' if ext_info.get('active', True) else 'Inactive'}\n",
+                f"Path: {ext_info.get('path', 'Unknown')}\n\n"
+            ]
             
             commands = ext_info.get("commands", [])
             if commands:
-                details += f"Commands ({len(commands)}):\n"
-                for cmd in commands:
-                    details += f"  • {cmd}\n"
-                details += "\n"
+                parts.append(f"Commands ({len(commands)}):\n")
+                parts.extend(f"  • {cmd}\n" for cmd in commands)
+                parts.append("\n")
             
             tools = ext_info.get("tools", [])
             if tools:
-                details += f"Tools ({len(tools)}):\n"
-                for tool in tools:
-                    details += f"  • {tool}\n"
+                parts.append(f"Tools ({len(tools)}):\n")
+                parts.extend(f"  • {tool}\n" for tool in tools)
             
             # Update details display
-            self.ext_details_text.delete("1.0", "end")
-            self.ext_details_text.insert("1.0", details)
+            self._set_text(self.ext_details_text, "".join(parts))
             
         except Exception as e:
             print(f"Error showing extension details: {e}")
@@ -891,3 +1306,23 @@ Common Commands:
 For more information, see the documentation in manual/14-extensions.md
         """
         messagebox.showinfo("Extension Help", help_text)
+
+class GUIInterface:
+    """GUI Interface wrapper for LEWIS"""
+    
+    def __init__(self, lewis_core):
+        self.lewis = lewis_core
+        self.gui = None
+    
+    def start(self):
+        """Start GUI interface"""
+        try:
+            self.gui = LewisGUI(self.lewis)
+            self.gui.start()
+        except Exception as e:
+            print(f"❌ Failed to start GUI: {e}")
+    
+    def stop(self):
+        """Stop GUI interface"""
+        if self.gui:
+            self.gui.stop()
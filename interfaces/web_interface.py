@@ -5,25 +5,92 @@ Provides REST API and web dashboard for LEWIS system
 """
 
 import asyncio
+import concurrent.futures
+import hashlib
 import json
 import logging
+import os
+import re
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.websockets import WebSocketState
+from jinja2 import TemplateNotFound
 from pydantic import BaseModel
 import uvicorn
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Binary WebSocket subprotocol offered to clients that advertise it
+MSGPACK_SUBPROTOCOL = "msgpack"
+
 from core.lewis_core import LewisCore
 from config.settings import Settings
 from utils.logger import Logger
 from security.security_manager import SecurityManager
+from reports.report_generator import ReportGenerator
+from analytics.analytics_engine import AnalyticsEngine
+
+# Dashboard pages rendered once at startup, they take no per-request context
+STATIC_PAGES = ("dashboard.html",)
+
+# Static asset names carrying a content hash (e.g. app.3f9c2a1b.js)
+HASHED_ASSET_PATTERN = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+# Content types of the report formats served by /api/report
+REPORT_MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "html": "text/html",
+    "json": "application/json"
+}
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+def _loads(data):
+    """Parse a JSON string or bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class CachedStaticFiles(StaticFiles):
+    """Static files served with browser caching headers"""
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        
+        # Content-hashed assets never change under the same name; others are
+        # revalidated through the ETag/Last-Modified headers FileResponse sets
+        if HASHED_ASSET_PATTERN.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=300"
+        return response
 
 class CommandRequest(BaseModel):
     input: str
@@ -50,26 +117,65 @@ class WebInterface:
             description="Linux Environment Working Intelligence System API",
             version="1.0.0",
             docs_url="/api/docs",
-            redoc_url="/api/redoc"
+            redoc_url="/api/redoc",
+            lifespan=self._lifespan,
+            default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
         )
         
         # Add CORS middleware
+        # Preflight results are cached by the browser for max_age seconds
         self.app.add_middleware(
             CORSMiddleware,
-            allow_origins=["*"],
+            allow_origins=settings.get("web.cors_origins", ["*"]),
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            allow_methods=["GET", "POST"],
+            allow_headers=["authorization", "content-type", "if-none-match"],
+            expose_headers=["etag"],
+            max_age=86400,
         )
         
         # Setup templates and static files
         self.templates = Jinja2Templates(directory="interfaces/templates")
+        self._pages: Dict[str, bytes] = {}
+        self._render_static_pages()
         
-        # WebSocket connections
-        self.active_connections: Dict[str, WebSocket] = {}
+        # WebSocket connections, weakly held so a connection whose cleanup was
+        # missed is still released, and capped at max_ws_connections
+        self.active_connections: "weakref.WeakValueDictionary[str, WebSocket]" = weakref.WeakValueDictionary()
+        self.max_ws_connections = settings.get("web.max_ws_connections", 256)
+        
+        # Client ids, least recently active first, for evicting at the cap
+        self._ws_recency: "OrderedDict[str, None]" = OrderedDict()
+        
+        # Connections that negotiated the binary msgpack subprotocol
+        self._msgpack_connections: "weakref.WeakSet[WebSocket]" = weakref.WeakSet()
+        
+        # Bounded pool for blocking extension reloads, off the event loop
+        self._reload_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="ext-reload"
+        )
+        
+        # Short-lived extension status cache as (timestamp, status), so a
+        # burst of dashboard polls computes the status once
+        self._status_cache = (0.0, None)
+        self._status_ttl = 1.0
         
         self._setup_routes()
     
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Create the services shared by all requests for the app's lifetime"""
+        app.state.report_gen = ReportGenerator(self.settings, self.logger)
+        app.state.analytics = AnalyticsEngine(self.settings, self.logger)
+        try:
+            yield
+        finally:
+            self._reload_pool.shutdown(wait=False)
+            for service in (app.state.report_gen, app.state.analytics):
+                aclose = getattr(service, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+    
     def _setup_routes(self):
         """Setup API routes"""
         
@@ -92,10 +198,10 @@ class WebInterface:
         
         # System status
         @self.app.get("/api/status")
-        async def get_status(user: dict = Depends(get_current_user)):
+        async def get_status(http_request: Request, user: dict = Depends(get_current_user)):
             try:
                 status = await self.lewis_core.get_system_status()
-                return {"status": "success", "data": status}
+                return self._etag_response(http_request, {"status": "success", "data": status})
             except Exception as e:
                 self.logger.error(f"Error getting system status: {str(e)}")
                 raise HTTPException(status_code=500, detail="Failed to get system status")
@@ -121,41 +227,42 @@ class WebInterface:
         
         # Generate report
         @self.app.post("/api/report")
-        async def generate_report(request: ReportRequest, user: dict = Depends(get_current_user)):
+        async def generate_report(request: ReportRequest, http_request: Request,
+                                  user: dict = Depends(get_current_user)):
             try:
-                # Import report generator
-                from reports.report_generator import ReportGenerator
-                
-                report_gen = ReportGenerator(self.settings, self.logger)
+                report_gen = http_request.app.state.report_gen
                 report_path = await report_gen.generate_report(
                     report_type=request.type,
                     format=request.format,
                     filters=request.filters,
                     user_id=user.get("user_id")
                 )
-                
-                return {"status": "success", "report_path": str(report_path)}
             except Exception as e:
                 self.logger.error(f"Error generating report: {str(e)}")
                 raise HTTPException(status_code=500, detail="Report generation failed")
+            
+            # Stream the report back instead of returning its server-side path
+            return StreamingResponse(
+                report_gen.iter_report_file(report_path),
+                media_type=REPORT_MEDIA_TYPES.get(request.format.lower(), "application/octet-stream"),
+                headers={"Content-Disposition": f'attachment; filename="{Path(report_path).name}"'}
+            )
         
         # Get available tools
         @self.app.get("/api/tools")
-        async def get_tools(user: dict = Depends(get_current_user)):
+        async def get_tools(http_request: Request, user: dict = Depends(get_current_user)):
             try:
                 tools = await self.lewis_core.tool_manager.get_available_tools()
-                return {"status": "success", "data": tools}
+                return self._etag_response(http_request, {"status": "success", "data": tools})
             except Exception as e:
                 self.logger.error(f"Error getting tools: {str(e)}")
                 raise HTTPException(status_code=500, detail="Failed to get tools")
         
         # Analytics data
         @self.app.get("/api/analytics")
-        async def get_analytics(user: dict = Depends(get_current_user)):
+        async def get_analytics(http_request: Request, user: dict = Depends(get_current_user)):
             try:
-                from analytics.analytics_engine import AnalyticsEngine
-                
-                analytics = AnalyticsEngine(self.settings, self.logger)
+                analytics = http_request.app.state.analytics
                 data = await analytics.get_dashboard_data(user.get("user_id"))
                 
                 return {"status": "success", "data": data}
@@ -166,40 +273,70 @@ class WebInterface:
         # WebSocket endpoint for real-time communication
         @self.app.websocket("/ws/{client_id}")
         async def websocket_endpoint(websocket: WebSocket, client_id: str):
-            await websocket.accept()
+            # At the cap, the least recently active connection makes room
+            if len(self.active_connections) >= self.max_ws_connections:
+                await self._evict_lru_connection()
+            
+            # Use the binary msgpack subprotocol when the client offers it,
+            # JSON text frames otherwise
+            offered = websocket.headers.get("sec-websocket-protocol", "")
+            use_msgpack = MSGPACK_AVAILABLE and MSGPACK_SUBPROTOCOL in (
+                protocol.strip() for protocol in offered.split(",")
+            )
+            
+            if use_msgpack:
+                await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL)
+                self._msgpack_connections.add(websocket)
+            else:
+                await websocket.accept()
             self.active_connections[client_id] = websocket
+            self._touch_connection(client_id)
             
             try:
                 while True:
-                    data = await websocket.receive_text()
-                    message = json.loads(data)
+                    if use_msgpack:
+                        message = msgpack.unpackb(await websocket.receive_bytes(), raw=False)
+                    else:
+                        message = _loads(await websocket.receive_text())
+                    self._touch_connection(client_id)
                     
                     # Process WebSocket message
                     response = await self._process_websocket_message(message, client_id)
-                    await websocket.send_text(json.dumps(response))
+                    if use_msgpack:
+                        await websocket.send_bytes(msgpack.packb(response, use_bin_type=True))
+                    else:
+                        await websocket.send_text(_dumps(response))
                     
             except WebSocketDisconnect:
-                if client_id in self.active_connections:
+                pass
+            except RuntimeError:
+                # Closed by the server to make room for a newer connection
+                if websocket.application_state != WebSocketState.DISCONNECTED:
+                    raise
+            finally:
+                if self.active_connections.get(client_id) is websocket:
                     del self.active_connections[client_id]
+                    self._ws_recency.pop(client_id, None)
           # Serve dashboard
         @self.app.get("/", response_class=HTMLResponse)
         async def dashboard():
-            return self.templates.TemplateResponse("dashboard.html", {"request": {}})
+            return self._page_response("dashboard.html")
         
-        # Serve extensions dashboard
+        # Serve extensions dashboard (no template ships for it yet, so this
+        # answers 404 until one is added to STATIC_PAGES)
         @self.app.get("/extensions", response_class=HTMLResponse)
         async def extensions_dashboard():
-            return self.templates.TemplateResponse("extensions.html", {"request": {}})
+            return self._page_response("extensions.html")
         
         # Serve static files
-        self.app.mount("/static", StaticFiles(directory="interfaces/static"), name="static")
+        self.app.mount("/static", CachedStaticFiles(directory="interfaces/static"), name="static")
     
         # Get extensions
         @self.app.get("/api/extensions")
-        async def get_extensions(user: dict = Depends(get_current_user)):
+        async def get_extensions(http_request: Request, user: dict = Depends(get_current_user)):
             try:
-                extension_status = self.lewis_core.get_extension_status()
-                return {"status": "success", "data": extension_status}
+                extension_status = self._cached_ext_status()
+                return self._etag_response(http_request, {"status": "success", "data": extension_status})
             except Exception as e:
                 self.logger.error(f"Error getting extensions: {str(e)}")
                 raise HTTPException(status_code=500, detail="Failed to get extensions")
@@ -213,11 +350,12 @@ class WebInterface:
                     raise HTTPException(status_code=403, detail="Admin permissions required")
                 
                 # Reload extensions
-                self.lewis_core.extension_manager.unload_all_extensions()
-                self.lewis_core.extension_manager.load_all_extensions()
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._reload_pool, self._do_reload)
                 
                 # Get updated status
-                extension_status = self.lewis_core.get_extension_status()
+                self._status_cache = (0.0, None)
+                extension_status = self._cached_ext_status()
                 
                 return {
                     "status": "success", 
@@ -233,19 +371,16 @@ class WebInterface:
         async def get_extension_commands(user: dict = Depends(get_current_user)):
             try:
                 available_commands = self.lewis_core.get_available_commands()
-                extension_commands = {}
                 
                 # Filter extension commands
-                extension_status = self.lewis_core.get_extension_status()
-                if extension_status and extension_status.get("loaded_extensions"):
-                    for ext_name, ext_info in extension_status["loaded_extensions"].items():
-                        ext_commands = ext_info.get("commands", [])
-                        for cmd in ext_commands:
-                            if cmd in available_commands:
-                                extension_commands[cmd] = {
-                                    "description": available_commands[cmd],
-                                    "extension": ext_name
-                                }
+                extension_status = self._cached_ext_status() or {}
+                loaded_extensions = extension_status.get("loaded_extensions") or {}
+                extension_commands = {
+                    cmd: {"description": available_commands[cmd], "extension": ext_name}
+                    for ext_name, ext_info in loaded_extensions.items()
+                    for cmd in ext_info.get("commands", ())
+                    if cmd in available_commands
+                }
                 
                 return {"status": "success", "data": extension_commands}
             except Exception as e:
@@ -254,6 +389,47 @@ class WebInterface:
 
         # ...existing code...
     
+    def _render_static_pages(self):
+        """Render the static dashboard pages once and keep the HTML bytes"""
+        pages = {}
+        for name in STATIC_PAGES:
+            try:
+                pages[name] = self.templates.get_template(name).render({"request": {}}).encode()
+            except TemplateNotFound:
+                self.logger.warning(f"Dashboard template not found: {name}")
+        self._pages = pages
+    
+    def _page_response(self, name: str) -> Response:
+        """Serve a pre-rendered dashboard page"""
+        page = self._pages.get(name)
+        if page is None:
+            raise HTTPException(status_code=404, detail="Page not found")
+        return Response(content=page, media_type="text/html")
+    
+    def _etag_response(self, request: Request, data: Dict[str, Any]) -> Response:
+        """JSON response tagged with a content hash, or 304 when the client's copy is current"""
+        payload = _dumps(data).encode()
+        etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=2"}
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=payload, media_type="application/json", headers=headers)
+    
+    def _cached_ext_status(self) -> Dict[str, Any]:
+        """Get extension status, recomputed at most once per _status_ttl seconds"""
+        now = time.monotonic()
+        timestamp, status = self._status_cache
+        if status is None or now - timestamp > self._status_ttl:
+            status = self.lewis_core.get_extension_status()
+            self._status_cache = (now, status)
+        return status
+    
+    def _do_reload(self):
+        """Unload and reload all extensions (runs on the reload pool)"""
+        self.lewis_core.extension_manager.unload_all_extensions()
+        self.lewis_core.extension_manager.load_all_extensions()
+    
     async def _process_websocket_message(self, message: Dict[str, Any], client_id: str) -> Dict[str, Any]:
         """Process WebSocket message"""
         try:
@@ -277,29 +453,69 @@ class WebInterface:
             self.logger.error(f"WebSocket message processing error: {str(e)}")
             return {"type": "error", "message": "Message processing failed"}
     
+    def _touch_connection(self, client_id: str):
+        """Mark a client's connection as the most recently active"""
+        self._ws_recency[client_id] = None
+        self._ws_recency.move_to_end(client_id)
+    
+    async def _evict_lru_connection(self):
+        """Close the least recently active connection that is still open"""
+        while self._ws_recency:
+            client_id, _ = self._ws_recency.popitem(last=False)
+            websocket = self.active_connections.pop(client_id, None)
+            if websocket is None:
+                continue
+            
+            try:
+                # 1013: try again later
+                await websocket.close(code=1013)
+            except Exception:
+                pass
+            return
+    
     async def broadcast_message(self, message: Dict[str, Any]):
         """Broadcast message to all connected clients"""
-        if self.active_connections:
-            disconnected = []
-            for client_id, websocket in self.active_connections.items():
-                try:
-                    await websocket.send_text(json.dumps(message))
-                except:
-                    disconnected.append(client_id)
-            
-            # Clean up disconnected clients
-            for client_id in disconnected:
-                del self.active_connections[client_id]
+        if not self.active_connections:
+            return
+        
+        # Serialize once per wire format and send to every client
+        # concurrently, so one slow client does not hold up the others
+        connections = list(self.active_connections.items())
+        text_payload = binary_payload = None
+        sends = []
+        for _, websocket in connections:
+            if websocket in self._msgpack_connections:
+                if binary_payload is None:
+                    binary_payload = msgpack.packb(message, use_bin_type=True)
+                sends.append(websocket.send_bytes(binary_payload))
+            else:
+                if text_payload is None:
+                    text_payload = _dumps(message)
+                sends.append(websocket.send_text(text_payload))
+        
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        
+        # Clean up disconnected clients
+        for (client_id, _), result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.active_connections.pop(client_id, None)
+                self._ws_recency.pop(client_id, None)
     
     def run(self, host: str = "0.0.0.0", port: int = 8000, debug: bool = False):
         """Run the web server"""
         self.logger.info(f"Starting LEWIS web interface on {host}:{port}")
         
+        # The app wraps this process's LewisCore instance, so it is served by
+        # a single worker. With uvicorn[standard] installed, "auto" selects
+        # the uvloop event loop and the httptools parser.
         uvicorn.run(
             self.app,
             host=host,
             port=port,
-            debug=debug,
+            loop="auto",
+            http="auto",
+            ws="auto",
+            access_log=debug,
             log_level="info" if not debug else "debug"
         )
 
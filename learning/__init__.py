@@ -4,6 +4,6 @@ Provides self-learning capabilities, knowledge base management, and adaptive lea
 """
 
 from .knowledge_base import KnowledgeBase
-from .self_learning import SelfLearning
+from .self_learning import SelfLearningEngine
 
-__all__ = ['KnowledgeBase', 'SelfLearning']
+__all__ = ['KnowledgeBase', 'SelfLearningEngine']
@@ -4,11 +4,251 @@ Manages cybersecurity knowledge, CVE data, and threat intelligence
 """
 
 import asyncio
+import copy
+import hashlib
 import json
-import requests
-from datetime import datetime, timedelta
+import re
+import time
+import zlib
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+from storage.database_manager import knowledge_search_text
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Search results are reused for SEARCH_CACHE_TTL seconds, keeping at most
+# SEARCH_CACHE_SIZE queries (least recently used evicted first)
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 300.0
+
+# Maximum number of CVE sources fetched at the same time
+CVE_FETCH_CONCURRENCY = 10
+
+# Connection pool of the HTTP session shared by CVE updates: open connections,
+# seconds DNS answers are cached and seconds idle connections are kept alive
+HTTP_POOL_SIZE = 32
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 75
+
+# Feed bodies are read in FEED_CHUNK_SIZE byte chunks; parsed CVEs are saved
+# CVE_BATCH_SIZE at a time, with at most CVE_SAVE_CONCURRENCY batches being
+# saved per feed while parsing continues
+FEED_CHUNK_SIZE = 64 * 1024
+CVE_BATCH_SIZE = 500
+CVE_SAVE_CONCURRENCY = 4
+
+# Path of the CVE items in NVD JSON feeds, by schema: 1.1 and 2.0
+CVE_ITEMS_PREFIXES = ("CVE_Items.item", "vulnerabilities.item")
+
+# ETag / Last-Modified of each CVE feed at its last successful update, used to
+# ask for the feed only if it changed
+CVE_VALIDATORS_FILE = Path("data") / "cve_feed_validators.json"
+
+# Categories small and read-mostly enough to be searched from memory
+IN_MEMORY_CATEGORIES = frozenset({"tools", "techniques"})
+
+# Seconds a knowledge entry count is reused before asking the store again
+ENTRY_COUNT_TTL = 60.0
+
+# Recommendations offered for each command intent
+_RECS_BY_INTENT = MappingProxyType({
+    "network_scanning": (
+        {
+            "type": "tool",
+            "title": "Advanced Nmap Scanning",
+            "description": "Use Nmap with script scanning for comprehensive results",
+            "command": "nmap -sV -sC -A <target>"
+        },
+        {
+            "type": "technique",
+            "title": "Service Enumeration",
+            "description": "Follow up port scans with service enumeration",
+            "next_steps": ["banner grabbing", "service version detection"]
+        }
+    ),
+    "vulnerability_assessment": (
+        {
+            "type": "tool",
+            "title": "Web Application Testing",
+            "description": "Use Nikto for web vulnerability scanning",
+            "command": "nikto -h <target>"
+        },
+        {
+            "type": "best_practice",
+            "title": "Vulnerability Prioritization",
+            "description": "Prioritize vulnerabilities by CVSS score and exploitability"
+        }
+    )
+})
+
+# CVE identifiers in free text
+CVE_PATTERN = re.compile(r"CVE-\d{4}-\d{4,7}", re.IGNORECASE)
+
+# Word tokens used for relevance ranking
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _content_hash(entry: Dict[str, Any]) -> str:
+    """Hash of a knowledge entry's fields, to skip rewriting unchanged entries"""
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode()).hexdigest()
+
+class _FeedReader:
+    """
+    Async file-like reader over a CVE feed response body
+    
+    The body is pulled in chunks as the parser asks for it, and gzip feeds
+    are decompressed on the fly, so only a chunk of the feed is held at once.
+    """
+    
+    def __init__(self, response: "aiohttp.ClientResponse", chunk_size: int = FEED_CHUNK_SIZE):
+        self._chunks = response.content.iter_chunked(chunk_size)
+        self._decompressor = None
+        self._started = False
+        self._buffer = bytearray()
+    
+    async def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                if self._decompressor:
+                    self._buffer += self._decompressor.flush()
+                    self._decompressor = None
+                break
+            
+            if not self._started:
+                self._started = True
+                if chunk[:2] == b"\x1f\x8b":
+                    self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            if self._decompressor:
+                chunk = self._decompressor.decompress(chunk)
+            self._buffer += chunk
+        
+        # Deleting from the front of a bytearray moves its start offset
+        # rather than copying what remains
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+class BM25Index:
+    """
+    Okapi BM25 index over knowledge entries
+    
+    Each entry is tokenized once when it is added. Term frequencies are kept
+    as per-term postings (document ids and counts), so a query is scored
+    with a few numpy operations per query term instead of substring scans
+    over every result. The numpy arrays are kept between queries and only
+    rebuilt for terms touched by new documents.
+    """
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        
+        self._doc_ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._doc_len: List[int] = []
+        self._postings: Dict[str, tuple] = {}
+        
+        # numpy views of the lists above, built on first use after a change
+        self._norm: Optional[np.ndarray] = None
+        self._posting_arrays: Dict[str, tuple] = {}
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._doc_ids
+    
+    def __len__(self) -> int:
+        return len(self._doc_len)
+    
+    def doc_id(self, key: str) -> int:
+        """Row of an indexed document in the score array"""
+        return self._doc_ids[key]
+    
+    def key(self, doc: int) -> str:
+        """Key of the document in a score array row"""
+        return self._keys[doc]
+    
+    def matching(self, query: str) -> set:
+        """Rows of the documents containing every indexed term of query"""
+        postings = [self._postings[term] for term in set(_tokenize(query)) if term in self._postings]
+        if not postings:
+            return set()
+        return set.intersection(*(set(docs) for docs, _ in postings))
+    
+    def add(self, key: str, text: str):
+        """Index a document's text under key (already indexed keys are kept)"""
+        if key in self._doc_ids:
+            return
+        
+        doc = len(self._doc_len)
+        self._doc_ids[key] = doc
+        self._keys.append(key)
+        
+        counts = Counter(_tokenize(text))
+        self._doc_len.append(sum(counts.values()))
+        self._norm = None
+        for term, tf in counts.items():
+            docs, tfs = self._postings.setdefault(term, ([], []))
+            docs.append(doc)
+            tfs.append(tf)
+            self._posting_arrays.pop(term, None)
+    
+    def _term_arrays(self, term: str) -> Optional[tuple]:
+        """Postings of term as (document ids, term frequencies) arrays"""
+        arrays = self._posting_arrays.get(term)
+        if arrays is None:
+            postings = self._postings.get(term)
+            if postings is None:
+                return None
+            arrays = self._posting_arrays[term] = (
+                np.asarray(postings[0]), np.asarray(postings[1], dtype=float)
+            )
+        return arrays
+    
+    def score(self, query: str) -> np.ndarray:
+        """BM25 score of every indexed document for query"""
+        n_docs = len(self._doc_len)
+        scores = np.zeros(n_docs)
+        if not n_docs:
+            return scores
+        
+        if self._norm is None:
+            doc_len = np.asarray(self._doc_len, dtype=float)
+            avgdl = doc_len.mean() or 1.0
+            self._norm = self.k1 * (1 - self.b + self.b * doc_len / avgdl)
+        norm = self._norm
+        
+        for term in set(_tokenize(query)):
+            arrays = self._term_arrays(term)
+            if arrays is None:
+                continue
+            
+            docs, tf = arrays
+            idf = np.log((n_docs - len(docs) + 0.5) / (len(docs) + 0.5) + 1)
+            scores[docs] += idf * tf * (self.k1 + 1) / (tf + norm[docs])
+        
+        return scores
 
 class KnowledgeBase:
     """
@@ -16,6 +256,9 @@ class KnowledgeBase:
     Handles CVE data, threat intelligence, and cybersecurity knowledge
     """
     
+    # Fields every knowledge entry must have
+    _REQUIRED_FIELDS = frozenset({"type", "category", "title", "content"})
+    
     def __init__(self, settings, logger, database_manager):
         self.settings = settings
         self.logger = logger
@@ -30,9 +273,28 @@ class KnowledgeBase:
             "best_practices": "Security Best Practices",
             "compliance": "Compliance and Standards"
         }
+        self._valid_categories = frozenset(self.categories)
         
-        # CVE data sources
+        # CVE data sources, and the HTTP session used to fetch them (created
+        # on first update and kept for the following ones)
         self.cve_sources = settings.get("learning.cve_sources", [])
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._feed_validators: Optional[Dict[str, Dict[str, str]]] = None
+        
+        # Relevance index over the default tools and techniques, and the
+        # entries themselves by index key
+        self._bm25 = BM25Index()
+        self._memory_docs: Dict[str, Dict[str, Any]] = {}
+        
+        # Recent searches: (query, category, limit) -> (cached_at, results)
+        self._search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        
+        # Default tools and techniques, saved to the database by initialize()
+        self._default_knowledge: tuple = ({}, {})
+        
+        # Cached entry count as (counted_at, count)
+        self._entry_count = (0.0, None)
         
         # Initialize knowledge base
         self._initialize_knowledge_base()
@@ -50,6 +312,10 @@ class KnowledgeBase:
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize knowledge base: {e}")
     
+    async def initialize(self):
+        """Save the default knowledge to the database"""
+        await self._save_default_knowledge(*self._default_knowledge)
+    
     def _load_default_knowledge(self):
         """Load default cybersecurity knowledge"""
         # Default tool information
@@ -146,35 +412,51 @@ class KnowledgeBase:
             }
         }
         
-        # Save default knowledge to database
-        asyncio.create_task(self._save_default_knowledge(default_tools, default_techniques))
+        # Saved to the database by initialize(), inside the event loop
+        self._default_knowledge = (default_tools, default_techniques)
     
     async def _save_default_knowledge(self, tools: Dict, techniques: Dict):
-        """Save default knowledge to database"""
+        """
+        Save default knowledge to database
+        
+        Each entry carries a hash of its content, so entries already stored
+        unchanged by a previous start are not written again.
+        """
         try:
-            # Save tools
-            for tool_name, tool_info in tools.items():
-                await self.db_manager.save_knowledge({
-                    "type": "tool",
-                    "name": tool_name,
-                    "category": tool_info["category"],
-                    "title": tool_info["title"],
-                    "content": tool_info,
-                    "keywords": [tool_name, tool_info["category"]]
-                })
-            
-            # Save techniques
-            for technique_name, technique_info in techniques.items():
-                await self.db_manager.save_knowledge({
-                    "type": "technique",
-                    "name": technique_name,
-                    "category": technique_info["category"],
-                    "title": technique_info["title"],
-                    "content": technique_info,
-                    "keywords": [technique_name, technique_info["category"]]
-                })
-                
-            self.logger.info("✅ Default knowledge saved to database")
+            entries = [
+                {
+                    "type": entry_type,
+                    "name": name,
+                    "category": info["category"],
+                    "title": info["title"],
+                    "content": info,
+                    "keywords": [name, info["category"]]
+                }
+                for entry_type, group in (("tool", tools), ("technique", techniques))
+                for name, info in group.items()
+            ]
+            
+            # One timestamp for the whole batch
+            added_at = datetime.now(timezone.utc)
+            for entry in entries:
+                entry["_doc_hash"] = _content_hash(entry)
+                entry["added_at"] = added_at
+                self._prepare_entry(entry)
+            
+            # Save new and changed tools and techniques in one write
+            written = await self.db_manager.upsert_knowledge_bulk(entries)
+            if written is None:
+                return
+            
+            for entry in entries:
+                self._index_entry(entry)
+            
+            self._search_cache.clear()
+            if written:
+                self._entry_count = (0.0, None)
+                self.logger.info(f"✅ Default knowledge saved to database ({written} entries written)")
+            else:
+                self.logger.info("✅ Default knowledge already up to date")
             
         except Exception as e:
             self.logger.error(f"❌ Error saving default knowledge: {e}")
@@ -196,42 +478,116 @@ class KnowledgeBase:
         Returns:
             List of matching knowledge entries
         """
+        # Cached results are handed out as deep copies, so callers editing
+        # them can't change what later searches get
+        cache_key = (query, category, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] <= SEARCH_CACHE_TTL:
+            self._search_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
+        
         try:
-            results = await self.db_manager.search_knowledge(query, category, limit)
+            # Tools and techniques are answered from the defaults in memory
+            # when those alone fill the limit; otherwise the database, which
+            # also holds entries added later, is searched
+            results = None
+            if category in IN_MEMORY_CATEGORIES:
+                results = self._search_in_memory(query, category, limit)
+            
+            if results is None or len(results) < limit:
+                results = await self.db_manager.search_knowledge(query, category, limit)
+                
+                # Results already ranked by the store (MongoDB text score) are
+                # used as is; others are ranked here
+                if not (results and all("relevance_score" in result for result in results)):
+                    # Enhance results with relevance scoring
+                    results = self._enhance_search_results(results, query)
             
-            # Enhance results with relevance scoring
-            enhanced_results = self._enhance_search_results(results, query)
+            self._search_cache[cache_key] = (time.monotonic(), results)
+            self._search_cache.move_to_end(cache_key)
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
             
-            return enhanced_results
+            return copy.deepcopy(results)
             
         except Exception as e:
             self.logger.error(f"❌ Error searching knowledge base: {e}")
             return []
     
+    def _search_in_memory(self, query: str, category: str, limit: int) -> List[Dict[str, Any]]:
+        """Search the default entries of category containing every query term"""
+        candidates = [
+            self._bm25.key(doc) for doc in self._bm25.matching(query)
+            if self._memory_docs.get(self._bm25.key(doc), {}).get("category") == category
+        ]
+        if not candidates:
+            return []
+        
+        scores = self._bm25.score(query)
+        ranked = sorted(candidates, key=lambda key: scores[self._bm25.doc_id(key)], reverse=True)
+        return [
+            dict(self._memory_docs[key], relevance_score=float(scores[self._bm25.doc_id(key)]))
+            for key in ranked[:limit]
+        ]
+    
     def _enhance_search_results(
         self, 
         results: List[Dict[str, Any]], 
         query: str
     ) -> List[Dict[str, Any]]:
-        """Enhance search results with relevance scoring"""
-        query_words = query.lower().split()
+        """
+        Enhance search results with BM25 relevance scoring
         
-        for result in results:
-            score = 0
-            content = str(result.get("content", "")).lower()
-            title = str(result.get("title", "")).lower()
-            
-            # Score based on title matches
-            for word in query_words:
-                if word in title:
-                    score += 3
-                if word in content:
-                    score += 1
-            
-            result["relevance_score"] = score
+        Only the returned results are indexed and scored, with their own term
+        statistics, so a query's ranking depends on it and its results alone
+        and nothing is kept between searches.
+        """
+        if not results:
+            return results
+        
+        index = BM25Index()
+        for position, result in enumerate(results):
+            text = result.get("_search_text")
+            if text is None:
+                text = knowledge_search_text(result)
+            index.add(str(position), text)
+        
+        scores = index.score(query)
+        for result, score in zip(results, scores):
+            result["relevance_score"] = float(score)
         
         # Sort by relevance
-        return sorted(results, key=lambda x: x.get("relevance_score", 0), reverse=True)
+        order = np.argsort(-scores, kind="stable")
+        return [results[i] for i in order]
+    
+    def _entry_key(self, entry: Dict[str, Any]) -> str:
+        """Stable key identifying a knowledge entry in the relevance index"""
+        return f"{entry.get('type', '')}:{entry.get('name') or entry.get('title', '')}"
+    
+    def _prepare_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store the entry's lowercased searchable text alongside it
+        
+        The title and nested content are flattened once at ingest, so
+        searching and ranking never re-serialize the content dict.
+        """
+        entry["_search_text"] = knowledge_search_text(entry)
+        return entry
+    
+    def _index_entry(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Add a default entry of an in-memory category to the relevance index"""
+        if entry.get("category") not in IN_MEMORY_CATEGORIES:
+            return None
+        
+        key = self._entry_key(entry)
+        if key not in self._bm25:
+            text = entry.get("_search_text")
+            if text is None:
+                text = self._prepare_entry(entry)["_search_text"]
+            self._bm25.add(key, text)
+        
+        self._memory_docs[key] = entry
+        return key
     
     async def get_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific tool"""
@@ -261,13 +617,16 @@ class KnowledgeBase:
                 return False
             
             # Add metadata
-            entry["added_at"] = datetime.utcnow()
+            entry["added_at"] = datetime.now(timezone.utc)
             entry["source"] = "user_input"
+            self._prepare_entry(entry)
             
             # Save to database
             success = await self.db_manager.save_knowledge(entry)
             
             if success:
+                self._search_cache.clear()
+                self._entry_count = (0.0, None)
                 self.logger.info(f"✅ Knowledge entry added: {entry.get('title')}")
             
             return success
@@ -278,15 +637,13 @@ class KnowledgeBase:
     
     def _validate_knowledge_entry(self, entry: Dict[str, Any]) -> bool:
         """Validate knowledge entry format"""
-        required_fields = ["type", "category", "title", "content"]
-        
-        for field in required_fields:
-            if field not in entry:
-                self.logger.warning(f"⚠️  Missing required field: {field}")
-                return False
+        missing = self._REQUIRED_FIELDS - entry.keys()
+        if missing:
+            self.logger.warning(f"⚠️  Missing required field: {', '.join(sorted(missing))}")
+            return False
         
         # Validate category
-        if entry["category"] not in self.categories:
+        if entry["category"] not in self._valid_categories:
             self.logger.warning(f"⚠️  Invalid category: {entry['category']}")
             return False
         
@@ -294,24 +651,40 @@ class KnowledgeBase:
     
     async def update_cve_data(self) -> bool:
         """Update CVE data from external sources"""
+        if not AIOHTTP_AVAILABLE:
+            self.logger.warning("⚠️  aiohttp not available, CVE updates disabled")
+            return False
+        
         try:
             self.logger.info("🔄 Updating CVE data...")
             
-            # This is a simplified implementation
-            # In real implementation, parse NVD/MITRE CVE feeds
-            
             success_count = 0
-            
-            for source_url in self.cve_sources:
+            if self._feed_validators is None:
+                self._feed_validators = self._load_feed_validators()
+            validators = dict(self._feed_validators)
+            
+            # Fetch all sources concurrently, at most CVE_FETCH_CONCURRENCY at once;
+            # each fetch saves the CVEs of its feed as they are parsed
+            semaphore = asyncio.Semaphore(CVE_FETCH_CONCURRENCY)
+            session = self._get_session()
+            fetched = await asyncio.gather(
+                *(self._fetch_cve_data(session, semaphore, url) for url in self.cve_sources),
+                return_exceptions=True
+            )
+            
+            for source_url, saved in zip(self.cve_sources, fetched):
                 try:
-                    cve_data = await self._fetch_cve_data(source_url)
-                    if cve_data:
-                        await self._process_cve_data(cve_data)
+                    if isinstance(saved, Exception):
+                        raise saved
+                    if saved is not None:
                         success_count += 1
                         
                 except Exception as e:
                     self.logger.error(f"❌ Error updating from {source_url}: {e}")
             
+            if self._feed_validators != validators:
+                self._save_feed_validators()
+            
             self.logger.info(f"✅ CVE data updated from {success_count} sources")
             return success_count > 0
             
@@ -319,33 +692,231 @@ class KnowledgeBase:
             self.logger.error(f"❌ Error updating CVE data: {e}")
             return False
     
-    async def _fetch_cve_data(self, source_url: str) -> Optional[Dict[str, Any]]:
-        """Fetch CVE data from external source"""
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        HTTP session shared by CVE updates
+        
+        Keeping one session keeps its connection pool, so later updates reuse
+        open keep-alive connections instead of repeating TCP and TLS setup.
+        A session belongs to the event loop it was created in, so a new one is
+        made when called from another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_POOL_SIZE,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+                )
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def _fetch_cve_data(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        source_url: str
+    ) -> Optional[int]:
+        """
+        Fetch a CVE feed and save its entries
+        
+        The feed is parsed while it downloads and CVEs are saved in batches
+        of CVE_BATCH_SIZE, so memory stays bounded whatever the feed size.
+        Batches are saved in the background, up to CVE_SAVE_CONCURRENCY at
+        once; parsing waits for a free slot before starting another.
+        
+        The request is conditional on the validators of the last successful
+        update, so an unchanged feed answers 304 without a body.
+        
+        Returns:
+            Number of CVEs saved (0 for an unchanged feed), or None if the feed
+            could not be fetched
+        """
         try:
-            # Simplified implementation - in real version, handle different CVE feed formats
-            response = requests.get(source_url, timeout=30)
-            if response.status_code == 200:
-                return {"data": "placeholder"}  # Placeholder for actual CVE data
-            
-            return None
+            headers = {}
+            validator = self._feed_validators.get(source_url, {})
+            if validator.get("etag"):
+                headers["If-None-Match"] = validator["etag"]
+            if validator.get("last_modified"):
+                headers["If-Modified-Since"] = validator["last_modified"]
+            
+            async with semaphore:
+                async with session.get(
+                    source_url, headers=headers, timeout=aiohttp.ClientTimeout(sock_read=60)
+                ) as response:
+                    if response.status == 304:
+                        self.logger.info(f"📄 CVE feed unchanged: {source_url}")
+                        return 0
+                    if response.status != 200:
+                        return None
+                    
+                    save_slots = asyncio.Semaphore(CVE_SAVE_CONCURRENCY)
+                    saves = []
+                    batch = []
+                    try:
+                        async for cve in self._iter_cve_items(response):
+                            batch.append(cve)
+                            if len(batch) >= CVE_BATCH_SIZE:
+                                await save_slots.acquire()
+                                saves.append(asyncio.create_task(self._save_cve_batch(save_slots, batch)))
+                                batch = []
+                        if batch:
+                            await save_slots.acquire()
+                            saves.append(asyncio.create_task(self._save_cve_batch(save_slots, batch)))
+                    finally:
+                        saved = await asyncio.gather(*saves, return_exceptions=True)
+                    
+                    # Remember the feed version only once all of it was saved
+                    if all(isinstance(count, int) for count in saved):
+                        self._feed_validators[source_url] = {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified")
+                        }
+                    return sum(count for count in saved if isinstance(count, int))
             
         except Exception as e:
             self.logger.error(f"❌ Error fetching CVE data from {source_url}: {e}")
             return None
     
-    async def _process_cve_data(self, cve_data: Dict[str, Any]):
-        """Process and save CVE data"""
-        # Placeholder for CVE data processing
-        # In real implementation, parse CVE entries and save to knowledge base
-        pass
+    def _load_feed_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load the stored CVE feed validators"""
+        try:
+            if CVE_VALIDATORS_FILE.exists():
+                return json.loads(CVE_VALIDATORS_FILE.read_text())
+        except Exception as e:
+            self.logger.error(f"❌ Error loading CVE feed validators: {e}")
+        return {}
+    
+    def _save_feed_validators(self):
+        """Store the CVE feed validators"""
+        try:
+            CVE_VALIDATORS_FILE.parent.mkdir(exist_ok=True)
+            CVE_VALIDATORS_FILE.write_text(json.dumps(self._feed_validators, indent=2))
+        except Exception as e:
+            self.logger.error(f"❌ Error saving CVE feed validators: {e}")
+    
+    async def _iter_cve_items(self, response: "aiohttp.ClientResponse"):
+        """Yield the CVE items of an NVD JSON feed (plain or gzip) one at a time"""
+        reader = _FeedReader(response)
+        if not IJSON_AVAILABLE:
+            # Without ijson the whole feed is parsed at once
+            feed = json.loads(await reader.read())
+            for item in feed.get("CVE_Items") or feed.get("vulnerabilities") or []:
+                yield item
+            return
+        
+        # Build each item under either schema's item path from the parse
+        # events; nested maps have longer prefixes, so an end_map at the
+        # item's own prefix closes it
+        builder = item_prefix = None
+        async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+            if builder is None:
+                if event == "start_map" and prefix in CVE_ITEMS_PREFIXES:
+                    builder, item_prefix = ijson.ObjectBuilder(), prefix
+                    builder.event(event, value)
+                continue
+            
+            builder.event(event, value)
+            if event == "end_map" and prefix == item_prefix:
+                yield builder.value
+                builder = None
     
-    def get_cve_info(self, entities: List[Dict[str, Any]]) -> Optional[str]:
-        """Get CVE information for entities"""
-        # Simplified implementation
-        cve_entities = [e for e in entities if e.get("type") == "cve"]
+    def _cve_entry(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build a knowledge entry from an NVD feed CVE item (1.1 or 2.0 schema)"""
+        cve = item.get("cve", {})
+        if "CVE_data_meta" in cve:
+            cve_id = cve["CVE_data_meta"].get("ID")
+            descriptions = cve.get("description", {}).get("description_data", [])
+            references = cve.get("references", {}).get("reference_data", [])
+            published = item.get("publishedDate")
+            
+            impact = item.get("impact", {})
+            metric = impact.get("baseMetricV3") or impact.get("baseMetricV2") or {}
+            cvss = metric.get("cvssV3") or metric.get("cvssV2") or {}
+            severity = cvss.get("baseSeverity") or metric.get("severity")
+        else:
+            cve_id = cve.get("id")
+            descriptions = [d for d in cve.get("descriptions", []) if d.get("lang", "en") == "en"]
+            references = cve.get("references", [])
+            published = cve.get("published")
+            
+            metrics = cve.get("metrics", {})
+            metric = next(
+                (metrics[key][0] for key in ("cvssMetricV31", "cvssMetricV30", "cvssMetricV2") if metrics.get(key)),
+                {}
+            )
+            cvss = metric.get("cvssData", {})
+            severity = cvss.get("baseSeverity") or metric.get("baseSeverity")
+        
+        if not cve_id:
+            return None
         
-        if cve_entities:
-            cve_ids = [e.get("value") for e in cve_entities]
+        return {
+            "type": "cve",
+            "category": "cve",
+            "name": cve_id,
+            "title": cve_id,
+            "content": {
+                "description": " ".join(d.get("value", "") for d in descriptions),
+                "cvss_score": cvss.get("baseScore"),
+                "severity": severity,
+                "published": published,
+                "references": [ref.get("url") for ref in references]
+            },
+            "source": "nvd"
+        }
+    
+    async def _save_cve_batch(self, save_slots: asyncio.Semaphore, cve_batch: List[Dict[str, Any]]) -> int:
+        """Save a batch of CVE feed items, then free its save slot"""
+        try:
+            return await self._process_cve_data(cve_batch)
+        finally:
+            save_slots.release()
+    
+    async def _process_cve_data(self, cve_batch: List[Dict[str, Any]]) -> int:
+        """
+        Save a batch of CVE feed items; returns the number written
+        
+        Entries are upserted by type and name, so refreshing a feed updates
+        changed CVEs in place and skips unchanged ones.
+        """
+        added_at = datetime.now(timezone.utc)
+        entries = [entry for entry in map(self._cve_entry, cve_batch) if entry]
+        for entry in entries:
+            entry["_doc_hash"] = _content_hash(entry)
+            entry["added_at"] = added_at
+            self._prepare_entry(entry)
+        if not entries:
+            return 0
+        
+        written = await self.db_manager.upsert_knowledge_bulk(entries)
+        if not written:
+            return 0
+        
+        self._search_cache.clear()
+        self._entry_count = (0.0, None)
+        return written
+    
+    def get_cve_info(self, entities: List[Any]) -> Optional[str]:
+        """Get CVE information for entities (entity dicts or raw text)"""
+        # Simplified implementation, a single pass over the entities
+        cve_ids = []
+        for entity in entities:
+            if isinstance(entity, str):
+                cve_ids.extend(CVE_PATTERN.findall(entity))
+            elif entity.get("type") == "cve" and (value := entity.get("value")):
+                cve_ids.append(value)
+        
+        if cve_ids:
             return f"Found CVE references: {', '.join(cve_ids)}"
         
         return None
@@ -353,58 +924,24 @@ class KnowledgeBase:
     def get_entry_count(self) -> int:
         """Get total number of knowledge entries"""
         try:
-            # This would query the database for count
-            # For now, return a placeholder
-            return 100  # Placeholder
+            # Status polling reuses the count for ENTRY_COUNT_TTL seconds; the
+            # store answers from collection metadata rather than a full count
+            now = time.monotonic()
+            counted_at, count = self._entry_count
+            if count is None or now - counted_at > ENTRY_COUNT_TTL:
+                count = self.db_manager.get_knowledge_count()
+                self._entry_count = (now, count)
+            return count
             
         except Exception as e:
             self.logger.error(f"❌ Error getting entry count: {e}")
             return 0
     
-    async def get_recommendations(
+    def get_recommendations(
         self, 
         context: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Get recommendations based on context"""
-        try:
-            recommendations = []
-            
-            # Tool recommendations based on intent
-            intent = context.get("intent")
-            
-            if intent == "network_scanning":
-                recommendations.extend([
-                    {
-                        "type": "tool",
-                        "title": "Advanced Nmap Scanning",
-                        "description": "Use Nmap with script scanning for comprehensive results",
-                        "command": "nmap -sV -sC -A <target>"
-                    },
-                    {
-                        "type": "technique",
-                        "title": "Service Enumeration",
-                        "description": "Follow up port scans with service enumeration",
-                        "next_steps": ["banner grabbing", "service version detection"]
-                    }
-                ])
-            
-            elif intent == "vulnerability_assessment":
-                recommendations.extend([
-                    {
-                        "type": "tool",
-                        "title": "Web Application Testing",
-                        "description": "Use Nikto for web vulnerability scanning",
-                        "command": "nikto -h <target>"
-                    },
-                    {
-                        "type": "best_practice",
-                        "title": "Vulnerability Prioritization",
-                        "description": "Prioritize vulnerabilities by CVSS score and exploitability"
-                    }
-                ])
-            
-            return recommendations
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error getting recommendations: {e}")
-            return []
+        # Tool recommendations based on intent, deep-copied so callers can't
+        # modify the shared templates or their lists
+        return copy.deepcopy(list(_RECS_BY_INTENT.get(context.get("intent"), ())))
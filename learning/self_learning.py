@@ -4,8 +4,15 @@ Implements machine learning-based adaptation and continuous learning
 """
 
 import asyncio
+import concurrent.futures
 import json
+import multiprocessing
 import pickle
+import random
+import re
+import sqlite3
+from collections import deque
+from functools import lru_cache
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
@@ -19,10 +26,290 @@ try:
     from sklearn.pipeline import Pipeline
     from sklearn.model_selection import train_test_split
     from sklearn.metrics import accuracy_score
+    from scipy import sparse
+    import joblib
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+try:
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import StringTensorType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Number of distinct inputs whose TF-IDF features are kept for repeat predictions
+INTENT_FEATURE_CACHE_SIZE = 4096
+
+# Keywords answered without the classifier: the most telling vocabulary
+# tokens of each intent, kept if the model alone gives them this confidence
+FAST_INTENT_RULES_PER_INTENT = 10
+FAST_INTENT_MIN_CONFIDENCE = 0.8
+
+# Tokens as the TF-IDF vectorizer splits them
+_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# Fields of the examples in each training data stream, with their dtypes
+TRAINING_STREAMS = {
+    "intents": {"text": object, "intent": object, "confidence": np.float32},
+    "commands": {"text": object, "success": bool, "execution_time": np.float32},
+    "responses": {"text": object, "response": object, "quality": np.float32}
+}
+
+# Streams kept as reservoirs stratified on a label field, so every label
+# stays represented instead of only the most recent examples
+STRATIFIED_STREAMS = {"intents": "intent"}
+
+def _response_quality_score(lengths, confidences, has_suggestions, context_used):
+    """
+    Quality scores of responses from their lengths, confidences and extras
+    
+    Works elementwise, on numpy arrays of a batch or on a single response's
+    scalars alike.
+    """
+    # Length check (not too short, not too long), confidence, presence of
+    # suggestions and context usage
+    scores = 0.3 * ((lengths >= 20) & (lengths <= 500))
+    scores = scores + 0.3 * confidences
+    scores = scores + 0.2 * has_suggestions
+    scores = scores + 0.2 * context_used
+    return np.minimum(scores, 1.0)
+
+def _best_classes(jll: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Most likely class of each row of joint log-likelihoods, with its probability
+    
+    Only the winning class's softmax is computed: one over the sum of the
+    row's likelihoods relative to its maximum.
+    """
+    best = np.argmax(jll, axis=1)
+    top = np.take_along_axis(jll, best[:, np.newaxis], axis=1)
+    return best, 1.0 / np.exp(jll - top).sum(axis=1)
+
+def _train_text_model(
+    model, texts: np.ndarray, labels: np.ndarray, untrained: List[Tuple[Any, Any]]
+) -> Optional[Tuple[Any, float]]:
+    """
+    Train a text pipeline on its examples, in a training worker process
+    
+    The worker receives a pickled copy of the serving pipeline, so the
+    original keeps serving predictions while the copy trains. A trained
+    model is updated online when the untrained (text, label) pairs are fewer
+    than the other examples and carry no new label: they are vectorized with
+    the existing vocabulary and passed to the classifier's partial_fit,
+    after measuring accuracy on them. Otherwise the pipeline is refit on all
+    examples, holding out a fifth for accuracy.
+    
+    Returns:
+        The trained pipeline and its accuracy, or None if the model was
+        trained and nothing is new
+    """
+    if hasattr(model.named_steps["classifier"], "classes_"):
+        if not untrained:
+            return None
+        
+        new_texts, new_labels = map(list, zip(*untrained))
+        if len(untrained) < len(texts) - len(untrained) and set(new_labels) <= set(model.classes_):
+            classifier = model.named_steps["classifier"]
+            features = model.named_steps["tfidf"].transform(new_texts)
+            accuracy = accuracy_score(new_labels, classifier.predict(features))
+            classifier.partial_fit(features, new_labels)
+            return model, accuracy
+    
+    # Split data
+    X_train, X_test, y_train, y_test = train_test_split(
+        texts, labels, test_size=0.2, random_state=42
+    )
+    model.fit(X_train, y_train)
+    
+    # Evaluate
+    return model, accuracy_score(y_test, model.predict(X_test))
+
+class TrainingBuffer:
+    """
+    Fixed-capacity ring buffer of training examples, stored column-wise
+    
+    Each field lives in one preallocated numpy array, so adding an example
+    writes a slot per column without allocating, and once the buffer is
+    full the oldest example is overwritten.
+    """
+    
+    def __init__(self, capacity: int, fields: Dict[str, Any]):
+        self.capacity = capacity
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in fields.items()}
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def fields(self) -> List[str]:
+        return list(self._columns)
+    
+    def append(self, **values):
+        """Add an example; None in a float field is stored as NaN"""
+        for name, column in self._columns.items():
+            value = values[name]
+            if value is None and column.dtype.kind == "f":
+                value = np.nan
+            column[self._head] = value
+        
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+    
+    def load(self, columns: Dict[str, Any]):
+        """Replace the examples with ones given column-wise, oldest first, keeping the newest"""
+        count = len(columns[self.fields[0]])
+        size = min(count, self.capacity)
+        for name, column in self._columns.items():
+            values = columns[name][count - size:]
+            if isinstance(values, list) and column.dtype.kind == "f":
+                values = [np.nan if value is None else value for value in values]
+            column[:size] = values
+        
+        self._head = size % self.capacity
+        self._size = size
+    
+    def column(self, name: str) -> np.ndarray:
+        """Values of a field, oldest example first"""
+        column = self._columns[name]
+        if self._size < self.capacity:
+            return column[:self._size]
+        return np.concatenate((column[self._head:], column[:self._head]))
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Examples as dicts of plain Python values, oldest first"""
+        columns = {name: self.column(name).tolist() for name in self._columns}
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+    
+    def replace(self, index: int, **values):
+        """Overwrite the example in a slot of a buffer that has not wrapped"""
+        for name, column in self._columns.items():
+            value = values[name]
+            if value is None and column.dtype.kind == "f":
+                value = np.nan
+            column[index] = value
+    
+    def remove(self, index: int):
+        """Drop the example in a slot of a buffer that has not wrapped, moving the last one into it"""
+        last = self._size - 1
+        for column in self._columns.values():
+            column[index] = column[last]
+        self._size = self._head = last
+
+class StratifiedReservoir:
+    """
+    Training examples sampled uniformly per label, within a total capacity
+    
+    Each label gets an equal share of the capacity. Until a label fills its
+    share its examples are all kept; after that each new one replaces a
+    random slot with reservoir probability (Algorithm R), so the share stays
+    a uniform sample of everything seen for that label. A new label makes
+    room by evicting a random example of the largest label. Every insertion
+    is O(1) and the examples are concatenated only when a column is read.
+    
+    Shares only shrink as labels are added, so each label's buffer is sized
+    to its share when the label first appears.
+    """
+    
+    def __init__(self, capacity: int, fields: Dict[str, Any], key: str):
+        self.capacity = capacity
+        self.key = key
+        self._fields = fields
+        self._strata: Dict[Any, TrainingBuffer] = {}
+        self._seen: Dict[Any, int] = {}
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def fields(self) -> List[str]:
+        return list(self._fields)
+    
+    def _stratum(self, label, size: int = 0) -> TrainingBuffer:
+        """Buffer of a label, created with room for its share or size examples"""
+        stratum = self._strata.get(label)
+        if stratum is None:
+            share = max(1, self.capacity // (len(self._strata) + 1))
+            stratum = self._strata[label] = TrainingBuffer(max(share, size), self._fields)
+            self._seen[label] = 0
+        return stratum
+    
+    def append(self, **values):
+        """Add an example to its label's reservoir"""
+        label = values[self.key]
+        stratum = self._stratum(label)
+        self._seen[label] += 1
+        
+        share = max(1, self.capacity // len(self._strata))
+        if len(stratum) >= share:
+            slot = random.randrange(self._seen[label])
+            if slot < len(stratum):
+                stratum.replace(slot, **values)
+            return
+        
+        if self._size >= self.capacity:
+            largest = max(self._strata.values(), key=len)
+            largest.remove(random.randrange(len(largest)))
+            self._size -= 1
+        stratum.append(**values)
+        self._size += 1
+    
+    def load(self, columns: Dict[str, Any], counts: Optional[Dict[Any, Tuple[int, int]]] = None):
+        """
+        Replace the examples with ones given column-wise, sampled in order
+        
+        Args:
+            columns: Examples column-wise, oldest first
+            counts: Saved (kept, seen) of each label, from counts(). The
+                first kept examples of such a label are its saved reservoir
+                and are restored as they are, with its seen total; later
+                ones are sampled into it.
+        """
+        self._strata.clear()
+        self._seen.clear()
+        self._size = 0
+        
+        counts = counts or {}
+        for label, (kept, seen) in counts.items():
+            self._stratum(label, kept)
+            self._seen[label] = seen
+        
+        restored = dict.fromkeys(counts, 0)
+        for values in zip(*(columns[name] for name in self._fields)):
+            example = dict(zip(self._fields, values))
+            label = example[self.key]
+            if label in counts and restored[label] < counts[label][0] and self._size < self.capacity:
+                self._strata[label].append(**example)
+                restored[label] += 1
+                self._size += 1
+            else:
+                self.append(**example)
+    
+    def counts(self) -> Dict[Any, Tuple[int, int]]:
+        """(kept, seen) of each label: examples held and examples ever added"""
+        return {label: (len(stratum), self._seen[label]) for label, stratum in self._strata.items()}
+    
+    def column(self, name: str) -> np.ndarray:
+        """Values of a field, grouped by label"""
+        if not self._strata:
+            return np.empty(0, dtype=self._fields[name])
+        return np.concatenate([stratum.column(name) for stratum in self._strata.values()])
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Examples as dicts of plain Python values, grouped by label"""
+        return [record for stratum in self._strata.values() for record in stratum.records()]
+
 class SelfLearningEngine:
     """
     Self-learning engine for LEWIS
@@ -40,22 +327,74 @@ class SelfLearningEngine:
         self.update_interval = settings.get("learning.update_interval", 3600)
         self.max_examples = settings.get("learning.max_learning_examples", 10000)
         
+        # Intent predictions requested while one is running are queued and
+        # run together, up to prediction_max_batch at a time
+        self.prediction_max_batch = settings.get("learning.prediction_max_batch", 32)
+        self._intent_lock = threading.Lock()
+        self._intent_pending: List[Tuple[str, concurrent.futures.Future]] = []
+        self._intent_predicting = False
+        
         # Learning models
         self.intent_classifier = None
         self.command_success_predictor = None
         self.response_quality_scorer = None
         
-        # Training data
+        # ONNX Runtime sessions serving predictions for the trained models
+        # (None while a model has no up-to-date ONNX export)
+        self._intent_session = None
+        self._command_session = None
+        
+        # TF-IDF rows of recent inputs to the intent classifier, keyed by the
+        # pipeline that vectorized them, so repeated phrasings skip
+        # tokenization (cleared whenever a new model is published)
+        self._intent_features = lru_cache(maxsize=INTENT_FEATURE_CACHE_SIZE)(self._vectorize_intent_input)
+        
+        # Keyword -> (intent, confidence) rules checked before the classifier,
+        # and the classifier's vocabulary they were built from
+        self._fast_intent_rules: Dict[str, Tuple[str, float]] = {}
+        self._fast_intent_vocabulary: Dict[str, int] = {}
+        
+        # Training data, max_examples of each stream: a stratified sample for
+        # labelled streams, the newest examples for the others
         self.training_data = {
-            "intents": [],
-            "commands": [],
-            "responses": []
+            stream: StratifiedReservoir(self.max_examples, fields, STRATIFIED_STREAMS[stream])
+            if stream in STRATIFIED_STREAMS else TrainingBuffer(self.max_examples, fields)
+            for stream, fields in TRAINING_STREAMS.items()
+        }
+        
+        # Append-only store of every example added, opened with the training
+        # data; models are saved on a worker thread, so the lock serializes
+        # the connection and the buffers with it
+        self._training_db: Optional[sqlite3.Connection] = None
+        self._training_db_lock = threading.Lock()
+        
+        # (text, label) of the examples added to each model's stream since it
+        # was last trained, which reservoir sampling may not have kept, and
+        # how many were ever added to each
+        self._untrained_examples = {
+            "intents": deque(maxlen=self.max_examples),
+            "commands": deque(maxlen=self.max_examples)
         }
+        self._untrained_added = {"intents": 0, "commands": 0}
+        
+        # Worker processes training the two models side by side, started on
+        # the first update
+        self._training_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._models_updating = False
         
         # Learning state
         self.learning_active = False
         self.last_model_update = None
+        self._last_update_ns = 0
         self.learning_thread = None
+        self._learning_task: Optional[asyncio.Task] = None
+        self._learning_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Wall-clock time matching a monotonic reading, so examples and
+        # updates are stamped with monotonic_ns and turned into datetimes
+        # only when needed
+        self._t0_wall = datetime.utcnow()
+        self._t0_ns = time.monotonic_ns()
         
         # Performance metrics
         self.metrics = {
@@ -63,7 +402,8 @@ class SelfLearningEngine:
             "model_accuracy": 0.0,
             "last_training_time": None,
             "successful_predictions": 0,
-            "total_predictions": 0
+            "total_predictions": 0,
+            "intent_model_version": 0
         }
         
         # Initialize learning engine
@@ -99,18 +439,40 @@ class SelfLearningEngine:
             self.logger.error(f"❌ Failed to initialize learning engine: {e}")
             self.learning_enabled = False
     
+    def warm_up(self):
+        """
+        Run one throwaway prediction through each loaded model
+        
+        Loaded models are memory-mapped and ONNX sessions allocate on their
+        first run, so this pays those costs up front. Safe to call from a
+        background thread.
+        """
+        try:
+            if not self.learning_enabled:
+                return
+            
+            if self.intent_classifier and hasattr(self.intent_classifier[-1], "classes_"):
+                self._predict_intents(["status"])
+            self.predict_command_success("status")
+            
+        except Exception as e:
+            self.logger.debug(f"Learning model warm-up failed: {e}")
+    
     def _initialize_models(self):
         """Initialize machine learning models"""
         try:
-            # Intent classification model
+            # Intent classification model; float32 features halve the size of
+            # the sparse matrices the classifier multiplies
             self.intent_classifier = Pipeline([
-                ('tfidf', TfidfVectorizer(max_features=1000, stop_words='english')),
+                ('tfidf', TfidfVectorizer(
+                    max_features=1000, stop_words='english', sublinear_tf=True, dtype=np.float32
+                )),
                 ('classifier', MultinomialNB())
             ])
             
             # Command success prediction model
             self.command_success_predictor = Pipeline([
-                ('tfidf', TfidfVectorizer(max_features=500)),
+                ('tfidf', TfidfVectorizer(max_features=500, sublinear_tf=True, dtype=np.float32)),
                 ('classifier', MultinomialNB())
             ])
             
@@ -141,7 +503,7 @@ class SelfLearningEngine:
             
             # Create learning example
             learning_example = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": time.monotonic_ns() - self._t0_ns,
                 "user_input": user_input,
                 "intent": intent_result.get("intent"),
                 "confidence": intent_result.get("confidence", 0.0),
@@ -170,28 +532,13 @@ class SelfLearningEngine:
     def _assess_response_quality(self, ai_response: Dict[str, Any]) -> float:
         """Assess quality of AI response"""
         try:
-            score = 0.0
-            
             # Basic quality indicators
-            response_text = ai_response.get("text", "")
-            
-            # Length check (not too short, not too long)
-            if 20 <= len(response_text) <= 500:
-                score += 0.3
-            
-            # Confidence score
-            confidence = ai_response.get("confidence", 0.0)
-            score += confidence * 0.3
-            
-            # Presence of suggestions
-            if ai_response.get("suggestions"):
-                score += 0.2
-            
-            # Context usage
-            if ai_response.get("context_used"):
-                score += 0.2
-            
-            return min(score, 1.0)
+            return float(_response_quality_score(
+                len(ai_response.get("text", "")),
+                float(ai_response.get("confidence", 0.0)),
+                bool(ai_response.get("suggestions")),
+                bool(ai_response.get("context_used"))
+            ))
             
         except Exception as e:
             self.logger.error(f"❌ Error assessing response quality: {e}")
@@ -200,45 +547,58 @@ class SelfLearningEngine:
     def _add_training_example(self, example: Dict[str, Any]):
         """Add example to training data"""
         try:
-            # Add to intent training data
-            self.training_data["intents"].append({
-                "text": example["user_input"],
-                "intent": example["intent"],
-                "confidence": example["confidence"]
-            })
+            # Add to intent training data; the buffers keep at most
+            # max_examples examples
+            self._record_example(
+                "intents",
+                text=example["user_input"],
+                intent=example["intent"],
+                confidence=example["confidence"]
+            )
+            self._untrained_examples["intents"].append((example["user_input"], example["intent"]))
+            self._untrained_added["intents"] += 1
             
             # Add to command success data
             if example["execution_success"] is not None:
-                self.training_data["commands"].append({
-                    "text": example["user_input"],
-                    "success": example["execution_success"],
-                    "execution_time": example["execution_time"]
-                })
+                self._untrained_examples["commands"].append((example["user_input"], example["execution_success"]))
+                self._untrained_added["commands"] += 1
+                self._record_example(
+                    "commands",
+                    text=example["user_input"],
+                    success=example["execution_success"],
+                    execution_time=example["execution_time"]
+                )
             
             # Add to response quality data
-            self.training_data["responses"].append({
-                "text": example["user_input"],
-                "response": example["ai_response"],
-                "quality": example["response_quality"]
-            })
-            
-            # Limit training data size
-            for data_type in self.training_data:
-                if len(self.training_data[data_type]) > self.max_examples:
-                    # Remove oldest examples
-                    self.training_data[data_type] = self.training_data[data_type][-self.max_examples:]
+            self._record_example(
+                "responses",
+                text=example["user_input"],
+                response=example["ai_response"],
+                quality=example["response_quality"]
+            )
             
         except Exception as e:
             self.logger.error(f"❌ Error adding training example: {e}")
     
+    def _record_example(self, stream: str, **values):
+        """Add an example to a stream's buffer and append it to the store"""
+        with self._training_db_lock:
+            self.training_data[stream].append(**values)
+            
+            if self._training_db is not None:
+                fields = TRAINING_STREAMS[stream]
+                self._training_db.execute(
+                    f"INSERT INTO {stream} VALUES ({', '.join('?' * len(fields))})",
+                    [values[name].item() if isinstance(values[name], np.generic) else values[name] for name in fields]
+                )
+    
     def _should_update_models(self) -> bool:
         """Check if models should be updated"""
         if not self.last_model_update:
             return len(self.training_data["intents"]) >= 50
         
         # Check time since last update
-        time_diff = datetime.utcnow() - self.last_model_update
-        if time_diff.total_seconds() > self.update_interval:
+        if (time.monotonic_ns() - self._last_update_ns) / 1e9 > self.update_interval:
             return True
         
         # Check if enough new data
@@ -247,28 +607,82 @@ class SelfLearningEngine:
     
     async def _update_models(self):
         """Update machine learning models with new data"""
+        # Training yields to the event loop, so an update triggered meanwhile
+        # is left to the next one rather than racing it
+        if self._models_updating:
+            return
+        self._models_updating = True
+        
         try:
             self.logger.info("🔄 Updating learning models...")
             
+            updates = []
+            
             # Update intent classifier
             if len(self.training_data["intents"]) >= 20:
-                await self._update_intent_classifier()
+                updates.append(self._update_intent_classifier())
             
             # Update command success predictor
             if len(self.training_data["commands"]) >= 20:
-                await self._update_command_predictor()
+                updates.append(self._update_command_predictor())
+            
+            # The models are independent, so they train concurrently
+            await asyncio.gather(*updates)
             
-            # Save updated models
-            self._save_models()
+            # Save updated models; exporting and writing them would block
+            # the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._save_models)
             
             # Update metrics
-            self.last_model_update = datetime.utcnow()
+            self._last_update_ns = time.monotonic_ns()
+            self.last_model_update = self._wall_time(self._last_update_ns - self._t0_ns)
             self.metrics["last_training_time"] = self.last_model_update.isoformat()
             
             self.logger.info("✅ Learning models updated successfully")
             
         except Exception as e:
             self.logger.error(f"❌ Error updating models: {e}")
+        finally:
+            self._models_updating = False
+    
+    def _wall_time(self, timestamp: int) -> datetime:
+        """UTC datetime of a timestamp in nanoseconds since the engine started"""
+        return self._t0_wall + timedelta(microseconds=timestamp // 1000)
+    
+    def _vectorize_intent_input(self, model, text: str):
+        """TF-IDF row of a single input to an intent classifier pipeline"""
+        return model.named_steps["tfidf"].transform([text])
+    
+    async def _train_in_worker(
+        self, model, texts: np.ndarray, labels: np.ndarray, untrained: List[Tuple[Any, Any]]
+    ) -> Optional[Tuple[Any, float]]:
+        """Run _train_text_model in a training worker process"""
+        if self._training_pool is None:
+            # Spawned rather than forked: forking would copy the event loop,
+            # the SQLite connection and any locks held by other threads
+            self._training_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("spawn")
+            )
+        
+        return await asyncio.get_running_loop().run_in_executor(
+            self._training_pool, _train_text_model, model, texts, labels, untrained
+        )
+    
+    def _mark_trained(self, stream: str, added: int, count: int):
+        """
+        Drop the untrained examples a model was just trained on
+        
+        Args:
+            stream: Training data stream of the model
+            added: Examples ever added to the stream when training began
+            count: Untrained examples passed to the training
+        """
+        pending = self._untrained_examples[stream]
+        
+        # Those still queued precede the ones added during training
+        trained = max(0, min(count, len(pending) - (self._untrained_added[stream] - added)))
+        for _ in range(trained):
+            pending.popleft()
     
     async def _update_intent_classifier(self):
         """Update intent classification model"""
@@ -276,20 +690,26 @@ class SelfLearningEngine:
             intent_data = self.training_data["intents"]
             
             # Prepare training data
-            texts = [item["text"] for item in intent_data]
-            intents = [item["intent"] for item in intent_data]
-            
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                texts, intents, test_size=0.2, random_state=42
-            )
-            
-            # Train model
-            self.intent_classifier.fit(X_train, y_train)
+            texts = intent_data.column("text")
+            intents = intent_data.column("intent")
+            
+            # Train a replacement model while the current one keeps serving;
+            # examples added meanwhile wait for the next update, and all of
+            # them are kept if training fails
+            untrained = list(self._untrained_examples["intents"])
+            added = self._untrained_added["intents"]
+            trained = await self._train_in_worker(self.intent_classifier, texts, intents, untrained)
+            self._mark_trained("intents", added, len(untrained))
+            if trained is None:
+                return
             
-            # Evaluate
-            y_pred = self.intent_classifier.predict(X_test)
-            accuracy = accuracy_score(y_test, y_pred)
+            # Publish it with one assignment; predictions use scikit-learn
+            # until it is exported again
+            self.intent_classifier, accuracy = trained
+            self._intent_session = None
+            self._intent_features.cache_clear()
+            self._build_fast_intent_rules()
+            self.metrics["intent_model_version"] += 1
             
             self.metrics["model_accuracy"] = accuracy
             self.logger.info(f"📊 Intent classifier accuracy: {accuracy:.3f}")
@@ -303,20 +723,23 @@ class SelfLearningEngine:
             command_data = self.training_data["commands"]
             
             # Prepare training data
-            texts = [item["text"] for item in command_data]
-            success_labels = [item["success"] for item in command_data]
-            
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                texts, success_labels, test_size=0.2, random_state=42
-            )
-            
-            # Train model
-            self.command_success_predictor.fit(X_train, y_train)
+            texts = command_data.column("text")
+            success_labels = command_data.column("success")
+            
+            # Train a replacement model while the current one keeps serving;
+            # examples added meanwhile wait for the next update, and all of
+            # them are kept if training fails
+            untrained = list(self._untrained_examples["commands"])
+            added = self._untrained_added["commands"]
+            trained = await self._train_in_worker(self.command_success_predictor, texts, success_labels, untrained)
+            self._mark_trained("commands", added, len(untrained))
+            if trained is None:
+                return
             
-            # Evaluate
-            y_pred = self.command_success_predictor.predict(X_test)
-            accuracy = accuracy_score(y_test, y_pred)
+            # Publish it with one assignment; predictions use scikit-learn
+            # until it is exported again
+            self.command_success_predictor, accuracy = trained
+            self._command_session = None
             
             self.logger.info(f"📊 Command predictor accuracy: {accuracy:.3f}")
             
@@ -324,27 +747,139 @@ class SelfLearningEngine:
             self.logger.error(f"❌ Error updating command predictor: {e}")
     
     def predict_intent(self, user_input: str) -> Tuple[str, float]:
-        """Predict intent using learned model"""
+        """
+        Predict intent using learned model
+        
+        Inputs the fast rules cover are answered from them. Others run on
+        the model at once when no prediction is in progress; callers from
+        other threads arriving meanwhile are queued and served together by
+        the thread already predicting.
+        """
         try:
             if not self.intent_classifier or not self.learning_enabled:
                 return "unknown", 0.0
             
-            # Predict intent
-            predicted_intent = self.intent_classifier.predict([user_input])[0]
+            fast_match = self._match_fast_intent(user_input)
+            if fast_match:
+                with self._intent_lock:
+                    self.metrics["total_predictions"] += 1
+                return fast_match
             
-            # Get confidence (simplified)
-            probabilities = self.intent_classifier.predict_proba([user_input])[0]
-            confidence = np.max(probabilities)
-            
-            # Update prediction metrics
-            self.metrics["total_predictions"] += 1
+            future = concurrent.futures.Future()
+            with self._intent_lock:
+                self._intent_pending.append((user_input, future))
+                leader = not self._intent_predicting
+                self._intent_predicting = True
             
-            return predicted_intent, confidence
+            if leader:
+                self._drain_intent_predictions()
+            return future.result()
             
         except Exception as e:
             self.logger.error(f"❌ Error predicting intent: {e}")
             return "unknown", 0.0
     
+    def _match_fast_intent(self, user_input: str) -> Optional[Tuple[str, float]]:
+        """
+        Intent of an input from the keyword rules, if they cover it and agree
+        
+        Every token the classifier would weigh must have a rule, so a
+        keyword never overrides other vocabulary that could change the
+        prediction; tokens outside the vocabulary carry no weight either way.
+        """
+        matches = []
+        for token in _TOKEN_PATTERN.findall(user_input.lower()):
+            if token in self._fast_intent_rules:
+                matches.append(self._fast_intent_rules[token])
+            elif token in self._fast_intent_vocabulary:
+                return None
+        
+        if not matches or any(intent != matches[0][0] for intent, _ in matches):
+            return None
+        return max(matches, key=lambda match: match[1])
+    
+    def _build_fast_intent_rules(self):
+        """
+        Rebuild the keyword rules from the trained intent classifier
+        
+        A lone token's TF-IDF weight is 1, so the classifier's confidence for
+        it is the softmax of its feature log-probabilities plus the priors.
+        """
+        classifier = self.intent_classifier.named_steps["classifier"]
+        if not hasattr(classifier, "feature_log_prob_"):
+            self._fast_intent_rules = {}
+            self._fast_intent_vocabulary = {}
+            return
+        
+        tfidf = self.intent_classifier.named_steps["tfidf"]
+        vocabulary = tfidf.get_feature_names_out()
+        jll = np.ascontiguousarray(
+            classifier.feature_log_prob_.T + classifier.class_log_prior_, dtype=np.float64
+        )
+        best, confidences = _best_classes(jll)
+        
+        rules = {}
+        for index, intent in enumerate(classifier.classes_):
+            tokens = np.flatnonzero((best == index) & (confidences >= FAST_INTENT_MIN_CONFIDENCE))
+            top = tokens[np.argsort(-confidences[tokens])[:FAST_INTENT_RULES_PER_INTENT]]
+            for token in top:
+                rules[str(vocabulary[token])] = (str(intent), float(confidences[token]))
+        self._fast_intent_vocabulary = tfidf.vocabulary_
+        self._fast_intent_rules = rules
+    
+    def _drain_intent_predictions(self):
+        """Run the queued intent predictions in batches until none are left"""
+        while True:
+            with self._intent_lock:
+                batch = self._intent_pending[:self.prediction_max_batch]
+                del self._intent_pending[:len(batch)]
+                if not batch:
+                    self._intent_predicting = False
+                    return
+            
+            try:
+                predictions = self._predict_intents([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            
+            # Update prediction metrics
+            with self._intent_lock:
+                self.metrics["total_predictions"] += len(batch)
+            
+            for (_, future), prediction in zip(batch, predictions):
+                future.set_result(prediction)
+    
+    def _predict_intents(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Predict intent and confidence for a batch of inputs"""
+        if self._intent_session is not None:
+            # Labels and class probabilities from the ONNX export
+            labels, probabilities = self._intent_session.run(
+                None, {"input": np.array(texts).reshape(-1, 1)}
+            )
+        else:
+            # Naive Bayes joint log-likelihoods are one sparse product with the
+            # feature log-probabilities; the pipeline is read once so a model
+            # published meanwhile cannot mix vocabularies
+            model = self.intent_classifier
+            classifier = model.named_steps["classifier"]
+            features = sparse.vstack([self._intent_features(model, text) for text in texts])
+            jll = np.ascontiguousarray(
+                features @ classifier.feature_log_prob_.T + classifier.class_log_prior_, dtype=np.float64
+            )
+            best, confidences = _best_classes(jll)
+            return [
+                (label, float(confidence))
+                for label, confidence in zip(classifier.classes_[best], confidences)
+            ]
+        
+        # The labels are the argmax classes, so their probabilities are read
+        # at the same index
+        best = np.argmax(probabilities, axis=1)
+        confidences = np.take_along_axis(probabilities, best[:, np.newaxis], axis=1)[:, 0]
+        return [(label, float(confidence)) for label, confidence in zip(labels, confidences)]
+    
     def predict_command_success(self, command: str) -> float:
         """Predict likelihood of command success"""
         try:
@@ -352,70 +887,86 @@ class SelfLearningEngine:
                 return 0.5
             
             # Predict success probability
-            probabilities = self.command_success_predictor.predict_proba([command])[0]
-            success_probability = probabilities[1] if len(probabilities) > 1 else 0.5
+            if self._command_session is not None:
+                _, probabilities = self._command_session.run(None, {"input": np.array([[command]])})
+                probabilities = probabilities[0]
+                return float(probabilities[1]) if len(probabilities) > 1 else 0.5
+            
+            model = self.command_success_predictor
+            classifier = model.named_steps["classifier"]
+            if len(getattr(classifier, "classes_", ())) < 2:
+                return 0.5
             
-            return success_probability
+            # With two classes the softmax of the joint log-likelihoods is a
+            # logistic of their difference, so no normalization pass is needed
+            jll = model.named_steps["tfidf"].transform([command]) @ classifier.feature_log_prob_.T \
+                + classifier.class_log_prior_
+            return float(1.0 / (1.0 + np.exp(jll[0, 0] - jll[0, 1])))
             
         except Exception as e:
             self.logger.error(f"❌ Error predicting command success: {e}")
             return 0.5
     
     def start_background_learning(self):
-        """Start background learning process"""
+        """
+        Start background learning process
+        
+        The learning loop runs as a task on the caller's event loop; called
+        outside one, it gets an event loop on a daemon thread.
+        """
         if not self.learning_enabled:
             return
         
         self.learning_active = True
-        self.learning_thread = threading.Thread(target=self._background_learning_loop, daemon=True)
-        self.learning_thread.start()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop:
+            loop.create_task(self._background_learning_loop())
+        else:
+            self.learning_thread = threading.Thread(
+                target=lambda: asyncio.run(self._background_learning_loop()), daemon=True
+            )
+            self.learning_thread.start()
         
         self.logger.info("🧠 Background learning started")
     
-    def _background_learning_loop(self):
+    async def _background_learning_loop(self):
         """Background learning loop"""
-        while self.learning_active:
-            try:
-                # Sleep for update interval
-                time.sleep(self.update_interval)
-                
-                # Update knowledge base
-                asyncio.run(self.knowledge_base.update_cve_data())
-                
-                # Perform model maintenance
-                self._perform_model_maintenance()
-                
-            except Exception as e:
-                self.logger.error(f"❌ Error in background learning: {e}")
+        # Kept so stop() can wake the loop from its sleep
+        self._learning_loop = asyncio.get_running_loop()
+        self._learning_task = asyncio.current_task()
+        try:
+            while self.learning_active:
+                try:
+                    # Sleep for update interval
+                    await asyncio.sleep(self.update_interval)
+                    
+                    # Update knowledge base
+                    await self.knowledge_base.update_cve_data()
+                    
+                    # Perform model maintenance
+                    self._perform_model_maintenance()
+                    
+                except Exception as e:
+                    self.logger.error(f"❌ Error in background learning: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # The knowledge base keeps its HTTP session on this loop
+            await self.knowledge_base.close()
     
     def _perform_model_maintenance(self):
         """Perform model maintenance tasks"""
         try:
-            # Clean old training data
-            self._clean_old_training_data()
-            
             # Update model performance metrics
             self._update_performance_metrics()
             
         except Exception as e:
             self.logger.error(f"❌ Error in model maintenance: {e}")
     
-    def _clean_old_training_data(self):
-        """Remove old training data to prevent memory issues"""
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-        
-        for data_type in self.training_data:
-            original_count = len(self.training_data[data_type])
-            
-            # Keep only recent data (if timestamps available)
-            # Simplified implementation - in real version, check timestamps
-            if original_count > self.max_examples:
-                self.training_data[data_type] = self.training_data[data_type][-self.max_examples:]
-                
-                removed_count = original_count - len(self.training_data[data_type])
-                if removed_count > 0:
-                    self.logger.debug(f"🧹 Cleaned {removed_count} old {data_type} examples")
-    
     def _update_performance_metrics(self):
         """Update learning performance metrics"""
         try:
@@ -439,27 +990,102 @@ class SelfLearningEngine:
             
             # Save intent classifier
             if self.intent_classifier:
-                with open(models_dir / "intent_classifier.pkl", "wb") as f:
-                    pickle.dump(self.intent_classifier, f)
+                self._dump_model(self.intent_classifier, models_dir / "intent_classifier.joblib")
             
             # Save command predictor
             if self.command_success_predictor:
-                with open(models_dir / "command_predictor.pkl", "wb") as f:
-                    pickle.dump(self.command_success_predictor, f)
-            
-            # Save training data
-            with open(models_dir / "training_data.json", "w") as f:
-                json.dump(self.training_data, f, indent=2)
-            
-            # Save metrics
-            with open(models_dir / "metrics.json", "w") as f:
-                json.dump(self.metrics, f, indent=2)
+                self._dump_model(self.command_success_predictor, models_dir / "command_predictor.joblib")
+            
+            # Export trained models to ONNX for inference
+            if self._intent_session is None:
+                self._intent_session = self._export_onnx(
+                    self.intent_classifier, models_dir / "intent_classifier.onnx"
+                )
+            if self._command_session is None:
+                self._command_session = self._export_onnx(
+                    self.command_success_predictor, models_dir / "command_predictor.onnx"
+                )
+            
+            # Commit the examples added since the last save
+            self._checkpoint_training_data()
+            
+            # Save a copy of the metrics, which the event loop keeps updating
+            metrics = dict(self.metrics)
+            metrics_file = models_dir / "metrics.json"
+            if ORJSON_AVAILABLE:
+                metrics_file.write_bytes(orjson.dumps(metrics, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                metrics_file.write_text(json.dumps(metrics))
                 
             self.logger.debug("💾 Models saved to disk")
             
         except Exception as e:
             self.logger.error(f"❌ Error saving models: {e}")
     
+    def _dump_model(self, model, model_file: Path):
+        """
+        Save a model uncompressed, so its arrays can be memory-mapped on load
+        
+        The file is written beside the target and renamed over it: the model
+        in use may be mapped from the old file, which must not be truncated.
+        """
+        temp_file = model_file.with_name(model_file.name + ".tmp")
+        joblib.dump(model, temp_file)
+        temp_file.replace(model_file)
+    
+    def _load_model(self, models_dir: Path, name: str):
+        """
+        Load a saved model, or None if there is none
+        
+        Arrays are memory-mapped copy-on-write, so they are paged in from
+        disk as needed and online updates only copy the pages they change.
+        Models pickled by earlier versions are still read.
+        """
+        model_file = models_dir / f"{name}.joblib"
+        if model_file.exists():
+            return joblib.load(model_file, mmap_mode="c")
+        
+        pickle_file = models_dir / f"{name}.pkl"
+        if pickle_file.exists():
+            with open(pickle_file, "rb") as f:
+                return pickle.load(f)
+        
+        return None
+    
+    def _export_onnx(self, model, onnx_file: Path):
+        """
+        Export a trained text pipeline to ONNX and open a session on it
+        
+        Returns:
+            ONNX Runtime inference session, or None if the model is not
+            trained or could not be exported
+        """
+        if not ONNX_AVAILABLE or not model or not hasattr(model[-1], "classes_"):
+            return None
+        
+        try:
+            # Probabilities as a plain tensor; text is normalized in the "C"
+            # locale, which unlike en_US is available on every system
+            onnx_model = convert_sklearn(
+                model,
+                initial_types=[("input", StringTensorType([None, 1]))],
+                options={MultinomialNB: {"zipmap": False}, TfidfVectorizer: {"locale": "C"}}
+            ).SerializeToString()
+            onnx_file.write_bytes(onnx_model)
+            return self._open_onnx_session(onnx_model)
+            
+        except Exception as e:
+            # A stale export must not be picked up on the next start
+            onnx_file.unlink(missing_ok=True)
+            self.logger.warning(f"⚠️  ONNX export failed, predicting with scikit-learn: {e}")
+            return None
+    
+    def _open_onnx_session(self, onnx_model):
+        """Open a CPU ONNX Runtime session on a model file or serialized model"""
+        if isinstance(onnx_model, Path):
+            onnx_model = str(onnx_model)
+        return ort.InferenceSession(onnx_model, providers=["CPUExecutionProvider"])
+    
     def _load_existing_models(self):
         """Load existing models from disk"""
         try:
@@ -469,40 +1095,138 @@ class SelfLearningEngine:
                 return
             
             # Load intent classifier
-            intent_file = models_dir / "intent_classifier.pkl"
-            if intent_file.exists():
-                with open(intent_file, "rb") as f:
-                    self.intent_classifier = pickle.load(f)
-                    self.logger.info("📂 Intent classifier loaded")
+            self.intent_classifier = self._load_model(models_dir, "intent_classifier")
+            if self.intent_classifier:
+                self._build_fast_intent_rules()
+                self.logger.info("📂 Intent classifier loaded")
             
             # Load command predictor
-            predictor_file = models_dir / "command_predictor.pkl"
-            if predictor_file.exists():
-                with open(predictor_file, "rb") as f:
-                    self.command_success_predictor = pickle.load(f)
-                    self.logger.info("📂 Command predictor loaded")
+            self.command_success_predictor = self._load_model(models_dir, "command_predictor")
+            if self.command_success_predictor:
+                self.logger.info("📂 Command predictor loaded")
+            
+            # Open inference sessions on the ONNX exports
+            if ONNX_AVAILABLE:
+                intent_onnx = models_dir / "intent_classifier.onnx"
+                if self.intent_classifier and intent_onnx.exists():
+                    self._intent_session = self._open_onnx_session(intent_onnx)
+                
+                predictor_onnx = models_dir / "command_predictor.onnx"
+                if self.command_success_predictor and predictor_onnx.exists():
+                    self._command_session = self._open_onnx_session(predictor_onnx)
             
             # Load metrics
             metrics_file = models_dir / "metrics.json"
             if metrics_file.exists():
-                with open(metrics_file, "r") as f:
-                    saved_metrics = json.load(f)
-                    self.metrics.update(saved_metrics)
-                    self.logger.info("📊 Metrics loaded")
+                self.metrics.update(self._read_json(metrics_file))
+                self.logger.info("📊 Metrics loaded")
                     
         except Exception as e:
             self.logger.error(f"❌ Error loading existing models: {e}")
     
+    def _read_json(self, json_file: Path) -> Any:
+        """Parse a JSON file, using orjson when it is installed"""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(json_file.read_bytes())
+        return json.loads(json_file.read_text())
+    
+    def _open_training_store(self, models_dir: Path) -> sqlite3.Connection:
+        """Open the SQLite store of training examples, one table per stream"""
+        models_dir.mkdir(exist_ok=True)
+        
+        # WAL with normal sync makes each append a cheap log write
+        db = sqlite3.connect(models_dir / "training.db", check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        for stream, fields in TRAINING_STREAMS.items():
+            db.execute(f"CREATE TABLE IF NOT EXISTS {stream} ({', '.join(fields)})")
+        
+        # Per-label counts of the stratified streams' reservoirs
+        db.execute("CREATE TABLE IF NOT EXISTS reservoir_counts (stream, label, kept, seen)")
+        db.commit()
+        return db
+    
+    def _checkpoint_training_data(self):
+        """
+        Commit appended examples and trim each stream's table
+        
+        Stratified streams are rewritten to exactly their reservoir, grouped
+        by label, with the label counts needed to resume sampling; the others
+        drop rows older than the newest max_examples.
+        """
+        with self._training_db_lock:
+            if self._training_db is None:
+                return
+            
+            for stream, fields in TRAINING_STREAMS.items():
+                if stream in STRATIFIED_STREAMS:
+                    reservoir = self.training_data[stream]
+                    self._training_db.execute(f"DELETE FROM {stream}")
+                    self._training_db.executemany(
+                        f"INSERT INTO {stream} ({', '.join(reservoir.fields)}) "
+                        f"VALUES ({', '.join('?' * len(reservoir.fields))})",
+                        [tuple(record[name] for name in reservoir.fields) for record in reservoir.records()]
+                    )
+                    self._training_db.execute("DELETE FROM reservoir_counts WHERE stream = ?", (stream,))
+                    self._training_db.executemany(
+                        "INSERT INTO reservoir_counts VALUES (?, ?, ?, ?)",
+                        [(stream, label, kept, seen) for label, (kept, seen) in reservoir.counts().items()]
+                    )
+                else:
+                    self._training_db.execute(
+                        f"DELETE FROM {stream} WHERE rowid <= (SELECT MAX(rowid) FROM {stream}) - ?",
+                        (self.max_examples,)
+                    )
+            self._training_db.commit()
+    
     def _load_training_data(self):
         """Load existing training data"""
         try:
             models_dir = Path("models")
-            training_file = models_dir / "training_data.json"
+            loaded = False
             
-            if training_file.exists():
-                with open(training_file, "r") as f:
-                    self.training_data = json.load(f)
-                    self.logger.info("📂 Training data loaded")
+            with self._training_db_lock:
+                self._training_db = self._open_training_store(models_dir)
+                
+                for stream, buffer in self.training_data.items():
+                    if stream in STRATIFIED_STREAMS:
+                        # The checkpointed reservoir, then the examples
+                        # appended after it, restored by label
+                        rows = self._training_db.execute(
+                            f"SELECT {', '.join(buffer.fields)} FROM {stream} ORDER BY rowid"
+                        ).fetchall()
+                        counts = {
+                            label: (kept, seen) for label, kept, seen in self._training_db.execute(
+                                "SELECT label, kept, seen FROM reservoir_counts WHERE stream = ?", (stream,)
+                            )
+                        }
+                        if rows:
+                            buffer.load(dict(zip(buffer.fields, map(list, zip(*rows)))), counts)
+                            loaded = True
+                        continue
+                    
+                    # Newest max_examples, oldest first
+                    rows = self._training_db.execute(
+                        f"SELECT {', '.join(buffer.fields)} FROM {stream} ORDER BY rowid DESC LIMIT ?",
+                        (self.max_examples,)
+                    ).fetchall()
+                    if rows:
+                        buffer.load(dict(zip(buffer.fields, map(list, zip(*reversed(rows))))))
+                        loaded = True
+            
+            # Training data saved as JSON by earlier versions moves into the store
+            training_file = models_dir / "training_data.json"
+            if not loaded and training_file.exists():
+                saved_data = self._read_json(training_file)
+                for stream, fields in TRAINING_STREAMS.items():
+                    for record in saved_data.get(stream, [])[-self.max_examples:]:
+                        self._record_example(stream, **{name: record.get(name) for name in fields})
+                with self._training_db_lock:
+                    self._training_db.commit()
+                loaded = True
+            
+            if loaded:
+                self.logger.info("📂 Training data loaded")
                     
         except Exception as e:
             self.logger.error(f"❌ Error loading training data: {e}")
@@ -511,12 +1235,20 @@ class SelfLearningEngine:
         """Stop learning engine"""
         self.learning_active = False
         
+        # Wake the learning loop from its sleep so it finishes now
+        if self._learning_task is not None and not self._learning_task.done():
+            self._learning_loop.call_soon_threadsafe(self._learning_task.cancel)
+        
         if self.learning_thread and self.learning_thread.is_alive():
             self.learning_thread.join(timeout=5)
         
         # Save models before stopping
         self._save_models()
         
+        if self._training_pool is not None:
+            self._training_pool.shutdown(wait=False, cancel_futures=True)
+            self._training_pool = None
+        
         self.logger.info("🧠 Learning engine stopped")
     
     def is_active(self) -> bool:
@@ -530,6 +1262,7 @@ class SelfLearningEngine:
             "active": self.learning_active,
             "interactions_learned": self.metrics["interactions_learned"],
             "model_accuracy": self.metrics.get("model_accuracy", 0.0),
+            "intent_model_version": self.metrics.get("intent_model_version", 0),
             "training_data_size": {
                 "intents": len(self.training_data["intents"]),
                 "commands": len(self.training_data["commands"]),
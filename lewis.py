@@ -12,6 +12,7 @@ import sys
 import argparse
 import logging
 import asyncio
+import threading
 from pathlib import Path
 
 # Add the project root to the Python path
@@ -99,6 +100,12 @@ async def main():
         lewis_core = LewisCore(settings, logger)
         await lewis_core.initialize()
         
+        # Page in the learned models while the rest of startup runs, so the
+        # first command doesn't pay for it
+        threading.Thread(
+            target=lewis_core.learning_engine.warm_up, name="lewis-warmup", daemon=True
+        ).start()
+        
         # Load extensions
         logger.info("🔌 Loading extensions...")
         extension_count = lewis_core.load_extensions()
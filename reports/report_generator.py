@@ -209,6 +209,16 @@ class ReportGenerator:
             self.logger.error(f"Report generation failed: {str(e)}")
             raise
     
+    async def iter_report_file(self, report_path: Path, chunk_size: int = 64 * 1024):
+        """Yield a generated report's contents in chunks, reading off the event loop"""
+        loop = asyncio.get_running_loop()
+        with open(report_path, "rb") as f:
+            while True:
+                chunk = await loop.run_in_executor(None, f.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
     async def _gather_report_data(self, report_type: str, filters: Dict[str, Any], user_id: str) -> Dict[str, Any]:
         """Gather data for report generation"""
         
@@ -4,18 +4,40 @@ Handles all database operations including user data, logs, and knowledge base
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterator, List, Optional
 import json
 import hashlib
+import uuid
 
 try:
-    from pymongo import MongoClient, IndexModel
+    from pymongo import MongoClient, IndexModel, UpdateOne
     from pymongo.errors import ConnectionFailure, DuplicateKeyError
     MONGODB_AVAILABLE = True
 except ImportError:
     MONGODB_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _flatten_strings(value: Any) -> Iterator[str]:
+    """Yield every string (and number) nested in dicts/lists of knowledge content"""
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten_strings(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _flatten_strings(item)
+    elif value is not None:
+        yield str(value)
+
+def knowledge_search_text(entry: Dict[str, Any]) -> str:
+    """Lowercased searchable text of a knowledge entry: its title and flattened content"""
+    return " ".join(_flatten_strings([entry.get("title", ""), entry.get("content", "")])).lower()
+
 class DatabaseManager:
     """
     Database manager for LEWIS
@@ -92,9 +114,21 @@ class DatabaseManager:
             if not storage_file.exists():
                 storage_file.write_text("[]")
         
+        self._backfill_search_text()
+        
         self.connected = True
         self.logger.info("✅ File-based storage initialized")
     
+    def _backfill_search_text(self):
+        """Store the searchable text of knowledge entries saved before it was kept"""
+        knowledge = self._load_from_file("knowledge")
+        missing = [entry for entry in knowledge if "_search_text" not in entry]
+        for entry in missing:
+            entry["_search_text"] = knowledge_search_text(entry)
+        if missing:
+            self._save_to_file("knowledge", knowledge)
+            self.logger.info(f"📁 Search text stored for {len(missing)} knowledge entries")
+    
     def _create_indexes(self):
         """Create database indexes for performance"""
         if not self.connected or not self.db:
@@ -116,6 +150,11 @@ class DatabaseManager:
             knowledge_collection = self.db[self.collections["knowledge"]]
             knowledge_collection.create_index([("type", 1), ("category", 1)])
             knowledge_collection.create_index("keywords")
+            knowledge_collection.create_index(
+                [("title", "text"), ("keywords", "text"), ("content.description", "text")],
+                weights={"title": 3, "keywords": 2, "content.description": 1},
+                name="knowledge_text"
+            )
             
             # Reports collection indexes
             reports_collection = self.db[self.collections["reports"]]
@@ -218,7 +257,7 @@ class DatabaseManager:
     async def save_knowledge(self, knowledge_data: Dict[str, Any]) -> bool:
         """Save knowledge base entry"""
         try:
-            knowledge_data["created_at"] = datetime.utcnow()
+            knowledge_data["created_at"] = datetime.now(timezone.utc)
             knowledge_data["id"] = self._generate_id()
             
             if self.db:
@@ -234,6 +273,77 @@ class DatabaseManager:
             self.logger.error(f"❌ Error saving knowledge: {e}")
             return False
     
+    async def upsert_knowledge_bulk(self, entries: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        Save knowledge entries keyed by type and name, skipping unchanged ones
+        
+        An entry is written only if no stored entry with its type and name has
+        the same _doc_hash; changed entries replace the stored fields and new
+        ones are inserted.
+        
+        Returns:
+            Number of entries written, or None on error
+        """
+        try:
+            def key(entry):
+                return (entry.get("type"), entry.get("name"))
+            
+            now = datetime.now(timezone.utc)
+            if self.db:
+                collection = self.db[self.collections["knowledge"]]
+                
+                def upsert_changed():
+                    stored = {
+                        key(doc): doc.get("_doc_hash")
+                        for doc in collection.find(
+                            {"name": {"$in": [entry.get("name") for entry in entries]}},
+                            {"type": 1, "name": 1, "_doc_hash": 1}
+                        )
+                    }
+                    changed = [entry for entry in entries if stored.get(key(entry)) != entry.get("_doc_hash")]
+                    
+                    if changed:
+                        collection.bulk_write([
+                            UpdateOne(
+                                {"type": entry.get("type"), "name": entry.get("name")},
+                                {"$set": entry, "$setOnInsert": {"id": self._generate_id(), "created_at": now}},
+                                upsert=True
+                            )
+                            for entry in changed
+                        ], ordered=False)
+                    return changed
+                
+                # Run the lookup and write on a worker thread so several
+                # batches can be in flight while the caller keeps producing
+                # entries
+                loop = asyncio.get_running_loop()
+                changed = await loop.run_in_executor(None, upsert_changed)
+            else:
+                # File storage is read, updated and rewritten in place on the
+                # event loop, so batches are saved one after another
+                knowledge = self._load_from_file("knowledge")
+                positions = {key(doc): i for i, doc in enumerate(knowledge)}
+                changed = [
+                    entry for entry in entries
+                    if key(entry) not in positions
+                    or knowledge[positions[key(entry)]].get("_doc_hash") != entry.get("_doc_hash")
+                ]
+                
+                for entry in changed:
+                    position = positions.get(key(entry))
+                    if position is None:
+                        knowledge.append({**entry, "id": self._generate_id(), "created_at": now})
+                    else:
+                        knowledge[position] = {**knowledge[position], **entry}
+                if changed:
+                    self._save_to_file("knowledge", knowledge)
+            
+            return len(changed)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error saving knowledge: {e}")
+            return None
+    
     async def search_knowledge(
         self, 
         query: str, 
@@ -243,12 +353,18 @@ class DatabaseManager:
         """Search knowledge base"""
         try:
             if self.db:
-                # MongoDB text search
+                # MongoDB text search, ranked and limited by the server
                 search_query = {"$text": {"$search": query}}
                 if category:
                     search_query["category"] = category
                 
-                cursor = self.db[self.collections["knowledge"]].find(search_query).limit(limit)
+                score = {"relevance_score": {"$meta": "textScore"}}
+                cursor = (
+                    self.db[self.collections["knowledge"]]
+                    .find(search_query, score)
+                    .sort([("relevance_score", {"$meta": "textScore"})])
+                    .limit(limit)
+                )
                 return list(cursor)
             else:
                 # Simple text search in file storage
@@ -260,11 +376,13 @@ class DatabaseManager:
                     if category and entry.get("category") != category:
                         continue
                     
-                    # Search in title and content
-                    title = entry.get("title", "").lower()
-                    content = entry.get("content", "").lower()
+                    # Search in title and content, using the lowercased text
+                    # stored with the entry (backfilled when storage starts)
+                    text = entry.get("_search_text")
+                    if text is None:
+                        text = knowledge_search_text(entry)
                     
-                    if query_lower in title or query_lower in content:
+                    if query_lower in text:
                         results.append(entry)
                     
                     if len(results) >= limit:
@@ -322,13 +440,15 @@ class DatabaseManager:
     
     def _generate_id(self) -> str:
         """Generate unique ID"""
-        return hashlib.md5(f"{datetime.utcnow().isoformat()}".encode()).hexdigest()
+        return uuid.uuid4().hex
     
     def _load_from_file(self, collection: str) -> List[Dict[str, Any]]:
         """Load data from file storage"""
         try:
             storage_file = self.storage_dir / f"{self.collections[collection]}.json"
             if storage_file.exists():
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(storage_file.read_bytes())
                 return json.loads(storage_file.read_text())
             return []
         except Exception as e:
@@ -339,7 +459,16 @@ class DatabaseManager:
         """Save data to file storage"""
         try:
             storage_file = self.storage_dir / f"{self.collections[collection]}.json"
-            storage_file.write_text(json.dumps(data, indent=2, default=str))
+            if ORJSON_AVAILABLE:
+                # Datetimes are passed through to str() so the stored format
+                # matches what the json fallback writes
+                storage_file.write_bytes(orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                ))
+            else:
+                storage_file.write_text(json.dumps(data, indent=2, default=str))
         except Exception as e:
             self.logger.error(f"❌ Error saving to file {collection}: {e}")
     
@@ -359,6 +488,16 @@ class DatabaseManager:
         except Exception:
             return 0
     
+    def get_knowledge_count(self) -> int:
+        """Get knowledge entry count (collection metadata estimate on MongoDB)"""
+        try:
+            if self.db:
+                return self.db[self.collections["knowledge"]].estimated_document_count()
+            else:
+                return len(self._load_from_file("knowledge"))
+        except Exception:
+            return 0
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
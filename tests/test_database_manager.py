@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Database manager tests
+Upserting knowledge entries into file and MongoDB storage
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from learning.knowledge_base import _content_hash
+from storage import database_manager
+from storage.database_manager import DatabaseManager
+
+
+def _settings():
+    """Settings stub returning the default of every key"""
+    settings = Mock()
+    settings.get.side_effect = lambda key, default=None: default
+    return settings
+
+
+def _entry(name: str, description: str) -> dict:
+    """CVE knowledge entry with its content hash"""
+    entry = {
+        "type": "cve",
+        "category": "cve",
+        "name": name,
+        "title": name,
+        "content": {"description": description},
+    }
+    entry["_doc_hash"] = _content_hash(entry)
+    return entry
+
+
+class TestKnowledgeUpsertFile(unittest.TestCase):
+    """Test knowledge upserts with file-based storage"""
+    
+    def setUp(self):
+        """Create a database manager storing files in a temporary directory"""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        
+        with patch.object(database_manager, "MONGODB_AVAILABLE", False):
+            self.db = DatabaseManager(_settings(), Mock())
+    
+    def tearDown(self):
+        """Remove the temporary directory"""
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def _upsert(self, entries):
+        return asyncio.run(self.db.upsert_knowledge_bulk(entries))
+    
+    def test_new_entries_inserted(self):
+        """Test that new entries are written with an id"""
+        written = self._upsert([_entry("CVE-2024-0001", "a"), _entry("CVE-2024-0002", "b")])
+        
+        stored = self.db._load_from_file("knowledge")
+        self.assertEqual(written, 2)
+        self.assertEqual(len(stored), 2)
+        self.assertTrue(all("id" in doc for doc in stored))
+    
+    def test_unchanged_entries_skipped(self):
+        """Test that entries with a stored hash are not rewritten"""
+        self._upsert([_entry("CVE-2024-0001", "a"), _entry("CVE-2024-0002", "b")])
+        
+        written = self._upsert([_entry("CVE-2024-0001", "a"), _entry("CVE-2024-0002", "b")])
+        
+        self.assertEqual(written, 0)
+        self.assertEqual(len(self.db._load_from_file("knowledge")), 2)
+    
+    def test_changed_entries_replaced(self):
+        """Test that a changed entry replaces the stored one and keeps its id"""
+        self._upsert([_entry("CVE-2024-0001", "a"), _entry("CVE-2024-0002", "b")])
+        stored_id = self.db._load_from_file("knowledge")[0]["id"]
+        
+        written = self._upsert([_entry("CVE-2024-0001", "updated"), _entry("CVE-2024-0002", "b")])
+        
+        stored = self.db._load_from_file("knowledge")
+        self.assertEqual(written, 1)
+        self.assertEqual(len(stored), 2)
+        self.assertEqual(stored[0]["content"]["description"], "updated")
+        self.assertEqual(stored[0]["id"], stored_id)
+
+
+class TestKnowledgeUpsertMongo(unittest.TestCase):
+    """Test knowledge upserts with a MongoDB collection"""
+    
+    def setUp(self):
+        """Create a database manager over a mock MongoDB collection"""
+        self.collection = Mock()
+        self.db = DatabaseManager.__new__(DatabaseManager)
+        self.db.logger = Mock()
+        self.db.collections = {"knowledge": "knowledge_base"}
+        self.db.db = {"knowledge_base": self.collection}
+    
+    def _upsert(self, entries):
+        with patch.object(database_manager, "UpdateOne", Mock(), create=True):
+            return asyncio.run(self.db.upsert_knowledge_bulk(entries))
+    
+    def test_only_changed_entries_written(self):
+        """Test that stored entries with the same hash are left out of the write"""
+        unchanged = _entry("CVE-2024-0001", "a")
+        changed = _entry("CVE-2024-0002", "b")
+        self.collection.find.return_value = [
+            {"type": "cve", "name": "CVE-2024-0001", "_doc_hash": unchanged["_doc_hash"]},
+            {"type": "cve", "name": "CVE-2024-0002", "_doc_hash": "old"},
+        ]
+        
+        written = self._upsert([unchanged, changed, _entry("CVE-2024-0003", "c")])
+        
+        self.assertEqual(written, 2)
+        operations = self.collection.bulk_write.call_args[0][0]
+        self.assertEqual(len(operations), 2)
+    
+    def test_nothing_written_when_unchanged(self):
+        """Test that no bulk write is sent when every entry is unchanged"""
+        entry = _entry("CVE-2024-0001", "a")
+        self.collection.find.return_value = [
+            {"type": "cve", "name": "CVE-2024-0001", "_doc_hash": entry["_doc_hash"]},
+        ]
+        
+        self.assertEqual(self._upsert([entry]), 0)
+        self.collection.bulk_write.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
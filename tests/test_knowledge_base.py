@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Knowledge base tests
+BM25 relevance ranking of knowledge search results and entry hashing
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from learning.knowledge_base import BM25Index, KnowledgeBase, _content_hash
+
+
+def _settings():
+    """Settings stub returning the default of every key"""
+    settings = Mock()
+    settings.get.side_effect = lambda key, default=None: default
+    return settings
+
+
+class TestBM25Index(unittest.TestCase):
+    """Test the BM25 index"""
+    
+    def setUp(self):
+        """Index a few small documents"""
+        self.index = BM25Index()
+        self.index.add("nmap", "nmap network scanner port scanning")
+        self.index.add("sqlmap", "sqlmap sql injection tool")
+        self.index.add("nikto", "nikto web server scanner")
+    
+    def test_empty_index(self):
+        """Test scoring an empty index"""
+        self.assertEqual(len(BM25Index().score("nmap")), 0)
+    
+    def test_matching_document_ranks_first(self):
+        """Test that documents containing the query term outscore the rest"""
+        scores = self.index.score("injection")
+        
+        self.assertGreater(scores[self.index.doc_id("sqlmap")], 0)
+        self.assertEqual(scores[self.index.doc_id("nmap")], 0)
+        self.assertEqual(scores[self.index.doc_id("nikto")], 0)
+    
+    def test_rare_terms_weigh_more(self):
+        """Test that a term found in fewer documents scores higher"""
+        index = BM25Index()
+        index.add("a", "scanner web")
+        index.add("b", "scanner port")
+        index.add("c", "scanner")
+        
+        scores = index.score("scanner web port")
+        
+        self.assertGreater(scores[index.doc_id("a")], scores[index.doc_id("c")])
+        self.assertAlmostEqual(scores[index.doc_id("a")], scores[index.doc_id("b")])
+    
+    def test_shorter_documents_score_higher(self):
+        """Test document length normalization"""
+        index = BM25Index()
+        index.add("short", "scanner")
+        index.add("long", "scanner with a much longer description")
+        
+        scores = index.score("scanner")
+        
+        self.assertGreater(scores[index.doc_id("short")], scores[index.doc_id("long")])
+    
+    def test_existing_key_is_kept(self):
+        """Test that adding an indexed key again leaves the index unchanged"""
+        before = self.index.score("scanner")
+        self.index.add("nmap", "something else entirely")
+        
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(list(self.index.score("scanner")), list(before))
+    
+    def test_scores_follow_new_documents(self):
+        """Test that cached arrays are rebuilt after documents are added"""
+        self.index.score("scanner")
+        self.index.add("masscan", "masscan fast port scanner")
+        
+        scores = self.index.score("scanner")
+        
+        self.assertEqual(len(scores), 4)
+        self.assertGreater(scores[self.index.doc_id("masscan")], 0)
+    
+    def test_matching(self):
+        """Test finding the documents that contain every query term"""
+        matches = {self.index.key(doc) for doc in self.index.matching("web scanner")}
+        
+        self.assertEqual(matches, {"nikto"})
+        self.assertEqual(self.index.matching("unknown"), set())
+
+
+class TestSearchResultRanking(unittest.TestCase):
+    """Test ranking of knowledge search results"""
+    
+    def setUp(self):
+        """Create a knowledge base over a mock database"""
+        self.kb = KnowledgeBase(_settings(), Mock(), Mock())
+    
+    def test_results_ranked_by_relevance(self):
+        """Test that results are sorted by their BM25 score"""
+        results = [
+            {"title": "SQL injection", "content": {"description": "database attacks"}},
+            {"title": "Nikto", "content": {"description": "web server scanner"}},
+            {"title": "Web scanning", "content": {"description": "web application scanner for web servers"}},
+        ]
+        
+        ranked = self.kb._enhance_search_results(results, "web scanner")
+        
+        self.assertEqual([r["title"] for r in ranked][-1], "SQL injection")
+        self.assertEqual(ranked[-1]["relevance_score"], 0)
+        scores = [r["relevance_score"] for r in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+    
+    def test_ties_keep_database_order(self):
+        """Test that results with equal scores stay in their original order"""
+        results = [{"title": f"entry {i}", "content": {}} for i in range(5)]
+        
+        ranked = self.kb._enhance_search_results(results, "unrelated")
+        
+        self.assertEqual([r["title"] for r in ranked], [f"entry {i}" for i in range(5)])
+    
+    def test_scores_use_only_returned_results(self):
+        """Test that a ranking does not depend on earlier searches"""
+        first = self.kb._enhance_search_results(
+            [{"title": "nmap scanner", "content": {}}, {"title": "nikto", "content": {}}], "scanner"
+        )
+        self.kb._enhance_search_results(
+            [{"title": f"scanner {i}", "content": {}} for i in range(20)], "scanner"
+        )
+        again = self.kb._enhance_search_results(
+            [{"title": "nmap scanner", "content": {}}, {"title": "nikto", "content": {}}], "scanner"
+        )
+        
+        self.assertEqual(
+            [r["relevance_score"] for r in first], [r["relevance_score"] for r in again]
+        )
+
+
+class TestContentHash(unittest.TestCase):
+    """Test knowledge entry content hashes"""
+    
+    def test_key_order_ignored(self):
+        """Test that the hash does not depend on field order"""
+        first = {"name": "CVE-2024-0001", "content": {"a": 1, "b": [1, 2]}}
+        second = {"content": {"b": [1, 2], "a": 1}, "name": "CVE-2024-0001"}
+        
+        self.assertEqual(_content_hash(first), _content_hash(second))
+    
+    def test_changed_content_changes_hash(self):
+        """Test that any changed nested field changes the hash"""
+        entry = {"name": "CVE-2024-0001", "content": {"severity": "HIGH"}}
+        changed = {"name": "CVE-2024-0001", "content": {"severity": "CRITICAL"}}
+        
+        self.assertNotEqual(_content_hash(entry), _content_hash(changed))
+
+
+if __name__ == '__main__':
+    unittest.main()
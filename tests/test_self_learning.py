@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Self-learning tests
+Columnar buffers and stratified reservoirs of training examples
+"""
+
+import math
+import random
+import unittest
+
+from learning.self_learning import TRAINING_STREAMS, StratifiedReservoir, TrainingBuffer
+
+
+class TestTrainingBuffer(unittest.TestCase):
+    """Test the training example ring buffer"""
+    
+    def setUp(self):
+        """Create a small buffer of command examples"""
+        self.buffer = TrainingBuffer(3, TRAINING_STREAMS["commands"])
+    
+    def _add(self, *texts):
+        for text in texts:
+            self.buffer.append(text=text, success=True, execution_time=1.0)
+    
+    def test_append(self):
+        """Test adding examples below capacity"""
+        self._add("a", "b")
+        
+        self.assertEqual(len(self.buffer), 2)
+        self.assertEqual(self.buffer.column("text").tolist(), ["a", "b"])
+    
+    def test_oldest_overwritten_when_full(self):
+        """Test that a full buffer drops its oldest example and stays in order"""
+        self._add("a", "b", "c", "d", "e")
+        
+        self.assertEqual(len(self.buffer), 3)
+        self.assertEqual(self.buffer.column("text").tolist(), ["c", "d", "e"])
+    
+    def test_none_stored_as_nan(self):
+        """Test that a missing float value is stored as NaN"""
+        self.buffer.append(text="a", success=False, execution_time=None)
+        
+        self.assertTrue(math.isnan(self.buffer.column("execution_time")[0]))
+    
+    def test_load_keeps_newest(self):
+        """Test that loading more examples than fit keeps the newest ones"""
+        self.buffer.load({
+            "text": ["a", "b", "c", "d"],
+            "success": [True, False, True, False],
+            "execution_time": [1.0, None, 3.0, 4.0],
+        })
+        
+        self.assertEqual(self.buffer.column("text").tolist(), ["b", "c", "d"])
+        self.assertTrue(math.isnan(self.buffer.column("execution_time")[0]))
+        
+        self._add("e")
+        self.assertEqual(self.buffer.column("text").tolist(), ["c", "d", "e"])
+    
+    def test_records(self):
+        """Test reading examples back as plain dicts"""
+        self.buffer.append(text="a", success=True, execution_time=0.5)
+        
+        self.assertEqual(
+            self.buffer.records(), [{"text": "a", "success": True, "execution_time": 0.5}]
+        )
+
+
+class TestStratifiedReservoir(unittest.TestCase):
+    """Test the reservoir of intent examples stratified on intent"""
+    
+    def setUp(self):
+        """Create a small reservoir with a fixed random seed"""
+        random.seed(0)
+        self.reservoir = StratifiedReservoir(10, TRAINING_STREAMS["intents"], "intent")
+    
+    def _add(self, intent, count, start=0):
+        for i in range(start, start + count):
+            self.reservoir.append(text=f"{intent} {i}", intent=intent, confidence=0.9)
+    
+    def test_labels_share_capacity(self):
+        """Test that a frequent label makes room for new ones"""
+        self._add("scan", 100)
+        self._add("help", 100)
+        
+        self.assertEqual(len(self.reservoir), 10)
+        self.assertEqual(self.reservoir.counts(), {"scan": (5, 100), "help": (5, 100)})
+    
+    def test_rare_label_kept(self):
+        """Test that every example of a label below its share is kept"""
+        self._add("scan", 100)
+        self._add("exploit", 2)
+        
+        texts = self.reservoir.column("text").tolist()
+        self.assertIn("exploit 0", texts)
+        self.assertIn("exploit 1", texts)
+        self.assertEqual(self.reservoir.counts()["scan"], (8, 100))
+    
+    def test_sample_spans_history(self):
+        """Test that a full label is sampled from all its examples, not just the latest"""
+        self._add("scan", 1000)
+        
+        kept = [int(text.split()[1]) for text in self.reservoir.column("text")]
+        self.assertEqual(len(kept), 10)
+        self.assertLess(min(kept), 990)
+    
+    def test_load_restores_counts(self):
+        """Test that saved examples and counts are restored as they were"""
+        self._add("scan", 50)
+        self._add("help", 30)
+        self._add("exploit", 3)
+        columns = {name: self.reservoir.column(name).tolist() for name in self.reservoir.fields}
+        
+        restored = StratifiedReservoir(10, TRAINING_STREAMS["intents"], "intent")
+        restored.load(columns, self.reservoir.counts())
+        
+        self.assertEqual(restored.counts(), self.reservoir.counts())
+        self.assertEqual(restored.records(), self.reservoir.records())
+    
+    def test_load_without_counts(self):
+        """Test that examples without saved counts are sampled in order"""
+        restored = StratifiedReservoir(4, TRAINING_STREAMS["intents"], "intent")
+        restored.load({
+            "text": ["a", "b", "c"],
+            "intent": ["scan", "scan", "help"],
+            "confidence": [0.5, None, 0.7],
+        })
+        
+        self.assertEqual(restored.counts(), {"scan": (2, 2), "help": (1, 1)})
+
+
+if __name__ == '__main__':
+    unittest.main()
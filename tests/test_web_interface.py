@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Web interface tests
+ETag revalidation of polled API responses
+"""
+
+import unittest
+from unittest.mock import Mock
+
+import pytest
+
+web_interface = pytest.importorskip("interfaces.web_interface")
+
+
+def _request(etag=None):
+    """Request stub carrying an If-None-Match header"""
+    request = Mock()
+    request.headers = {"if-none-match": etag} if etag else {}
+    return request
+
+
+class TestETagResponse(unittest.TestCase):
+    """Test ETag responses of polled endpoints"""
+    
+    def setUp(self):
+        """Create a web interface without starting its server"""
+        self.web = web_interface.WebInterface.__new__(web_interface.WebInterface)
+        self.data = {"status": "success", "data": {"tools": ["nmap", "nikto"]}}
+    
+    def test_response_tagged(self):
+        """Test that a fresh request gets the JSON body and caching headers"""
+        response = self.web._etag_response(_request(), self.data)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.media_type, "application/json")
+        self.assertTrue(response.headers["etag"].startswith('"'))
+        self.assertEqual(response.headers["cache-control"], "private, max-age=2")
+        self.assertEqual(web_interface._loads(response.body), self.data)
+    
+    def test_matching_etag_not_modified(self):
+        """Test that a client holding the current ETag gets an empty 304"""
+        etag = self.web._etag_response(_request(), self.data).headers["etag"]
+        
+        response = self.web._etag_response(_request(etag), self.data)
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
+        self.assertEqual(response.headers["etag"], etag)
+    
+    def test_changed_data_new_etag(self):
+        """Test that changed data gets a new ETag and a full response"""
+        etag = self.web._etag_response(_request(), self.data).headers["etag"]
+        changed = {"status": "success", "data": {"tools": ["nmap"]}}
+        
+        response = self.web._etag_response(_request(etag), changed)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+
+
+if __name__ == '__main__':
+    unittest.main()